@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 from abc import ABC, abstractmethod
@@ -48,6 +49,21 @@ def load_current_events_config() -> dict:
         return yaml.safe_load(f)
 
 
+def title_id(prefix: str, title: str) -> str:
+    """Stable dedup ID for items without a URL or DOI: prefix + 64-bit title hash."""
+    digest = hashlib.blake2b(title.encode("utf-8"), digest_size=8).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def legacy_title_id(prefix: str, title: str) -> str:
+    """Pre-hash ID format (title truncated to 50 chars).
+
+    Still checked during dedup so items recorded before the switch to
+    title_id() are not re-sent; drop once old history entries age out.
+    """
+    return f"{prefix}:{title[:50]}"
+
+
 class HistoryStore:
     """Deduplication history with file locking."""
 
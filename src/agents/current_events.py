@@ -7,7 +7,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from src.agents.base import BaseAgent, load_current_events_config
+from src.agents.base import BaseAgent, legacy_title_id, load_current_events_config, title_id
 from src.sources import rss, browser
 from src import delivery
 
@@ -65,7 +65,8 @@ class CurrentEventsAgent(BaseAgent):
             items = rss.fetch_multiple(feed_list, max_per_feed=8)
             for item in items:
                 all_items.append({
-                    "id": item.url or f"{item.source}:{item.title[:50]}",
+                    "id": item.url or title_id(item.source, item.title),
+                    "legacy_id": "" if item.url else legacy_title_id(item.source, item.title),
                     "title": item.title,
                     "source": item.source,
                     "url": item.url,
@@ -76,31 +77,31 @@ class CurrentEventsAgent(BaseAgent):
 
         # Optionally scrape paywalled sites
         paywalled = self._ce_config.get("paywalled", [])
-        if browser.is_available() and paywalled:
-            for site in paywalled:
-                if not site.get("enabled", False):
-                    continue
-                articles = browser.scrape_headlines(
-                    site["url"],
-                    source_name=site["name"],
-                    max_items=5,
-                    use_auth=True,
-                )
-                for a in articles:
-                    all_items.append({
-                        "id": a.url,
-                        "title": a.title,
-                        "source": a.source,
-                        "url": a.url,
-                        "summary": a.snippet,
-                        "published": "",
-                        "topic_hint": "",
-                    })
+        enabled_sites = [site for site in paywalled if site.get("enabled", False)]
+        if browser.is_available() and enabled_sites:
+            try:
+                articles = browser.scrape_many(enabled_sites, max_items=5, use_auth=True)
+            finally:
+                # Runs may land on any scheduler thread; don't leave a Chromium behind on each
+                browser.close_pool()
+            for a in articles:
+                all_items.append({
+                    "id": a.url,
+                    "title": a.title,
+                    "source": a.source,
+                    "url": a.url,
+                    "summary": a.snippet,
+                    "published": "",
+                    "topic_hint": "",
+                })
 
         return all_items
 
     def dedup(self, items: list[dict], seen_ids: set[str]) -> list[dict]:
-        return [item for item in items if item["id"] not in seen_ids]
+        return [
+            item for item in items
+            if item["id"] not in seen_ids and item.get("legacy_id") not in seen_ids
+        ]
 
     def extract_ids(self, items: list[dict]) -> list[str]:
         return [item["id"] for item in items]
@@ -163,14 +164,15 @@ class CurrentEventsAgent(BaseAgent):
         briefing = result.get("briefing", "No briefing available")
         items = result.get("items", [])
         count = len(items)
-        today = datetime.now().strftime("%Y-%m-%d")
-        time_label = datetime.now().strftime("%H:%M")
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
+        time_label = now.strftime("%H:%M")
 
         if "text" in self.delivery_methods:
             delivery.send_text(briefing)
 
         if "email" in self.delivery_methods:
-            html = self._build_html(result)
+            html = self._build_html(result, f"{today} {time_label}")
             delivery.send_email(f"Current Events Briefing - {today} {time_label}", html)
 
         if "notification" in self.delivery_methods:
@@ -184,7 +186,7 @@ class CurrentEventsAgent(BaseAgent):
                 f"{count} items: {topic_summary}",
             )
 
-    def _build_html(self, result: dict) -> str:
+    def _build_html(self, result: dict, timestamp: str) -> str:
         items = result.get("items", [])
 
         # Group by topic for organized display
@@ -245,7 +247,7 @@ class CurrentEventsAgent(BaseAgent):
             </table>"""
 
         return f"""<html><body>
-        <h2>Current Events Briefing - {datetime.now().strftime('%Y-%m-%d %H:%M')}</h2>
+        <h2>Current Events Briefing - {timestamp}</h2>
         <p style="font-size:16px;background:#f5f5f5;padding:12px;border-radius:6px;">
         {html_mod.escape(result.get('briefing', ''))}</p>
         {sections_html}
@@ -106,7 +106,8 @@ class EmailTriageAgent(BaseAgent):
     def deliver(self, result: dict[str, Any]) -> None:
         urgent_count = result.get("urgent_count", 0)
         items = result.get("items", [])
-        today = datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
 
         if "text" in self.delivery_methods and urgent_count > 0:
             urgent_subjects = [
@@ -118,7 +119,7 @@ class EmailTriageAgent(BaseAgent):
             delivery.send_text(msg)
 
         if "email" in self.delivery_methods:
-            html = self._build_html(result)
+            html = self._build_html(result, now.strftime("%Y-%m-%d %H:%M"))
             delivery.send_email(f"Email Triage - {today}", html)
 
         if "file" in self.delivery_methods:
@@ -142,7 +143,7 @@ class EmailTriageAgent(BaseAgent):
                         f"Email: {item['subject']} - {item.get('next_action', 'Review')}",
                     )
 
-    def _build_html(self, result: dict) -> str:
+    def _build_html(self, result: dict, timestamp: str) -> str:
         items = result.get("items", [])
         rows = ""
         for item in items:
@@ -164,7 +165,7 @@ class EmailTriageAgent(BaseAgent):
             </tr>"""
 
         return f"""<html><body>
-        <h2>Email Triage - {datetime.now().strftime('%Y-%m-%d %H:%M')}</h2>
+        <h2>Email Triage - {timestamp}</h2>
         <p>{html.escape(result.get('summary', ''))}</p>
         <p><strong>Urgent items:</strong> {result.get('urgent_count', 0)}</p>
         <table border="1" cellpadding="6" cellspacing="0" style="border-collapse:collapse;">
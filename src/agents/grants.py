@@ -155,14 +155,14 @@ class GrantsAgent(BaseAgent):
             delivery.send_text(msg)
 
         if "email" in self.delivery_methods:
-            html = self._build_html(result)
+            html = self._build_html(result, today)
             delivery.send_email(f"Grant Opportunities - {today}", html)
 
         if "file" in self.delivery_methods:
-            html = self._build_html(result)
+            html = self._build_html(result, today)
             delivery.save_draft(f"grants_{today}.html", html)
 
-    def _build_html(self, result: dict) -> str:
+    def _build_html(self, result: dict, today: str) -> str:
         opportunities = result.get("opportunities", [])
         rows = ""
         for opp in opportunities:
@@ -185,7 +185,7 @@ class GrantsAgent(BaseAgent):
             </tr>"""
 
         return f"""<html><body>
-        <h2>Grant Opportunities - {datetime.now().strftime('%Y-%m-%d')}</h2>
+        <h2>Grant Opportunities - {today}</h2>
         <p>{html.escape(result.get('summary', ''))}</p>
         <table border="1" cellpadding="6" cellspacing="0" style="border-collapse:collapse;">
         <tr><th>Relevance</th><th>Title</th><th>FOA</th><th>Agency</th>
@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import html
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
-from src.agents.base import BaseAgent, load_feeds_config
+from src.agents.base import BaseAgent, legacy_title_id, load_feeds_config, title_id
 from src.sources import pubmed, arxiv, biorxiv
 from src import delivery
 
@@ -45,27 +46,37 @@ class LiteratureAgent(BaseAgent):
         categories = lit_config.get("arxiv_categories", ["cs.AI", "cs.CL", "cs.LG"])
         bio_subjects = lit_config.get("biorxiv_subjects", ["bioinformatics"])
 
-        all_papers: list[dict] = []
-
-        # PubMed
-        for term in search_terms:
-            articles = pubmed.search_and_fetch(term, max_results=10)
-            for a in articles:
-                all_papers.append({
-                    "id": f"PMID:{a.pmid}",
-                    "title": a.title,
-                    "authors": a.authors,
-                    "abstract": a.abstract,
-                    "source": f"PubMed - {a.source}",
-                    "url": a.url,
-                    "date": a.pub_date,
-                })
-
-        # arXiv
+        # The three services are independent, so query them side by side;
+        # results are still listed PubMed, arXiv, bioRxiv
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(self._fetch_pubmed, search_terms),
+                pool.submit(self._fetch_arxiv, search_terms, categories),
+                pool.submit(self._fetch_biorxiv, bio_subjects),
+            ]
+            return [paper for future in futures for paper in future.result()]
+
+    def _fetch_pubmed(self, search_terms: list[str]) -> list[dict]:
+        # All searches first, then a single efetch for every hit
+        return [
+            {
+                "id": f"PMID:{a.pmid}",
+                "title": a.title,
+                "authors": a.authors,
+                "abstract": a.abstract,
+                "source": f"PubMed - {a.source}",
+                "url": a.url,
+                "date": a.pub_date,
+            }
+            for a in pubmed.search_and_fetch_many(search_terms, max_per_query=10)
+        ]
+
+    def _fetch_arxiv(self, search_terms: list[str], categories: list[str]) -> list[dict]:
+        papers = []
+        # Sequential on purpose: arXiv asks clients to space out API calls
         for term in search_terms[:2]:  # Limit to avoid rate limiting
-            papers = arxiv.search(term, categories=categories, max_results=10)
-            for p in papers:
-                all_papers.append({
+            for p in arxiv.search(term, categories=categories, max_results=10):
+                papers.append({
                     "id": f"arxiv:{p.arxiv_id}",
                     "title": p.title,
                     "authors": p.authors,
@@ -74,13 +85,15 @@ class LiteratureAgent(BaseAgent):
                     "url": p.url,
                     "date": p.published,
                 })
+        return papers
 
-        # bioRxiv
+    def _fetch_biorxiv(self, bio_subjects: list[str]) -> list[dict]:
+        papers = []
         for subject in bio_subjects:
-            papers = biorxiv.fetch(subject=subject, max_results=10)
-            for p in papers:
-                all_papers.append({
-                    "id": f"doi:{p.doi}" if p.doi else f"biorxiv:{p.title[:50]}",
+            for p in biorxiv.fetch(subject=subject, max_results=10):
+                papers.append({
+                    "id": f"doi:{p.doi}" if p.doi else title_id("biorxiv", p.title),
+                    "legacy_id": "" if p.doi else legacy_title_id("biorxiv", p.title),
                     "title": p.title,
                     "authors": p.authors,
                     "abstract": p.abstract,
@@ -88,11 +101,13 @@ class LiteratureAgent(BaseAgent):
                     "url": p.url,
                     "date": p.published,
                 })
-
-        return all_papers
+        return papers
 
     def dedup(self, items: list[dict], seen_ids: set[str]) -> list[dict]:
-        return [item for item in items if item["id"] not in seen_ids]
+        return [
+            item for item in items
+            if item["id"] not in seen_ids and item.get("legacy_id") not in seen_ids
+        ]
 
     def extract_ids(self, items: list[dict]) -> list[str]:
         return [item["id"] for item in items]
@@ -120,11 +135,16 @@ class LiteratureAgent(BaseAgent):
             return None
 
         # Merge LLM assessments with source data (which has real URLs)
-        assessments = {a["item_number"]: a for a in llm_result.get("assessments", [])}
+        assessments = {
+            a["item_number"]: a
+            for a in llm_result.get("assessments", [])
+            if isinstance(a.get("item_number"), int)
+        }
         merged_papers = []
-        for i, item in enumerate(limited, 1):
-            if i in assessments:
-                a = assessments[i]
+        for item_num, a in sorted(assessments.items()):
+            idx = item_num - 1
+            if 0 <= idx < len(limited):
+                item = limited[idx]
                 merged_papers.append({
                     "title": item["title"],
                     "authors": item["authors"],
@@ -144,24 +164,17 @@ class LiteratureAgent(BaseAgent):
         summary = result.get("summary", "No summary available")
         papers = result.get("papers", [])
         count = len(papers)
+        today = datetime.now().strftime("%Y-%m-%d")
 
         if "text" in self.delivery_methods:
             msg = f"{summary}\n\n{count} papers found."
             delivery.send_text(msg)
 
-        if "email" in self.delivery_methods:
-            html = self._build_html(result)
-            delivery.send_email(
-                f"Literature Digest - {datetime.now().strftime('%Y-%m-%d')}",
-                html,
-            )
-
         if "file" in self.delivery_methods or "email" in self.delivery_methods:
-            html = self._build_html(result)
-            delivery.save_draft(
-                f"literature_{datetime.now().strftime('%Y-%m-%d')}.html",
-                html,
-            )
+            html = self._build_html(result, today)
+            if "email" in self.delivery_methods:
+                delivery.send_email(f"Literature Digest - {today}", html)
+            delivery.save_draft(f"literature_{today}.html", html)
 
         if "notification" in self.delivery_methods:
             delivery.send_notification(
@@ -169,7 +182,7 @@ class LiteratureAgent(BaseAgent):
                 f"{count} new papers in clinical AI",
             )
 
-    def _build_html(self, result: dict) -> str:
+    def _build_html(self, result: dict, today: str) -> str:
         papers = result.get("papers", [])
         rows = ""
         for p in papers:
@@ -186,7 +199,7 @@ class LiteratureAgent(BaseAgent):
             </tr>"""
 
         return f"""<html><body>
-        <h2>Literature Digest - {datetime.now().strftime('%Y-%m-%d')}</h2>
+        <h2>Literature Digest - {today}</h2>
         <p>{html.escape(result.get('summary', ''))}</p>
         <table border="1" cellpadding="6" cellspacing="0" style="border-collapse:collapse;">
         <tr><th>Title</th><th>Authors</th><th>Source</th><th>Summary</th><th>Relevance</th><th>Tags</th></tr>
@@ -7,7 +7,7 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from src.agents.base import BaseAgent, load_feeds_config
+from src.agents.base import BaseAgent, legacy_title_id, load_feeds_config, title_id
 from src.sources import rss
 from src import delivery
 
@@ -46,7 +46,8 @@ class NewsAgent(BaseAgent):
         items = rss.fetch_multiple(feed_list, max_per_feed=10)
         return [
             {
-                "id": item.url or f"{item.source}:{item.title[:50]}",
+                "id": item.url or title_id(item.source, item.title),
+                "legacy_id": "" if item.url else legacy_title_id(item.source, item.title),
                 "title": item.title,
                 "source": item.source,
                 "url": item.url,
@@ -57,7 +58,10 @@ class NewsAgent(BaseAgent):
         ]
 
     def dedup(self, items: list[dict], seen_ids: set[str]) -> list[dict]:
-        return [item for item in items if item["id"] not in seen_ids]
+        return [
+            item for item in items
+            if item["id"] not in seen_ids and item.get("legacy_id") not in seen_ids
+        ]
 
     def extract_ids(self, items: list[dict]) -> list[str]:
         return [item["id"] for item in items]
@@ -83,11 +87,16 @@ class NewsAgent(BaseAgent):
             return None
 
         # Merge LLM selections with source data
-        selections = {s["item_number"]: s for s in llm_result.get("selected_items", [])}
+        selections = {
+            s["item_number"]: s
+            for s in llm_result.get("selected_items", [])
+            if isinstance(s.get("item_number"), int)
+        }
         merged_items = []
-        for i, item in enumerate(limited, 1):
-            if i in selections:
-                s = selections[i]
+        for item_num, s in sorted(selections.items()):
+            idx = item_num - 1
+            if 0 <= idx < len(limited):
+                item = limited[idx]
                 merged_items.append({
                     "title": item["title"],
                     "source": item["source"],
@@ -106,13 +115,14 @@ class NewsAgent(BaseAgent):
         headline = result.get("headline_summary", "No summary available")
         items = result.get("items", [])
         count = len(items)
-        today = datetime.now().strftime("%Y-%m-%d")
+        now = datetime.now()
+        today = now.strftime("%Y-%m-%d")
 
         if "text" in self.delivery_methods:
             delivery.send_text(headline)
 
         if "email" in self.delivery_methods:
-            html = self._build_html(result)
+            html = self._build_html(result, now.strftime("%Y-%m-%d %H:%M"))
             delivery.send_email(f"News Digest - {today}", html)
 
         if "notification" in self.delivery_methods:
@@ -121,7 +131,7 @@ class NewsAgent(BaseAgent):
                 f"{count} items: {headline[:100]}",
             )
 
-    def _build_html(self, result: dict) -> str:
+    def _build_html(self, result: dict, timestamp: str) -> str:
         items = result.get("items", [])
         rows = ""
         for item in items:
@@ -143,7 +153,7 @@ class NewsAgent(BaseAgent):
             </tr>"""
 
         return f"""<html><body>
-        <h2>News Digest - {datetime.now().strftime('%Y-%m-%d %H:%M')}</h2>
+        <h2>News Digest - {timestamp}</h2>
         <p>{html.escape(result.get('headline_summary', ''))}</p>
         <table border="1" cellpadding="6" cellspacing="0" style="border-collapse:collapse;">
         <tr><th>Category</th><th>Title</th><th>Source</th><th>Summary</th><th>Relevance</th></tr>
@@ -8,6 +8,7 @@ import smtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
+from typing import Any
 
 from src.bridge_client import health as bridge_health, run_shortcut
 
@@ -16,6 +17,10 @@ logger = logging.getLogger(__name__)
 PROJECT_ROOT = Path(__file__).parent.parent
 DRAFTS_DIR = PROJECT_ROOT / "data" / "drafts"
 
+# Reused Twilio client and the credentials it was built with
+_twilio_client: Any = None
+_twilio_creds: tuple[str, str] | None = None
+
 
 def send_text(message: str) -> bool:
     """Send via Shortcuts Bridge text shortcut. Falls back to Twilio if bridge is down."""
@@ -98,10 +103,28 @@ def create_reminder(title: str, due_date: str | None = None) -> bool:
     return False
 
 
+def reset_twilio_client() -> None:
+    """Drop the cached Twilio client so the next send rebuilds it."""
+    global _twilio_client, _twilio_creds
+    _twilio_client = None
+    _twilio_creds = None
+
+
+def _get_twilio_client(account_sid: str, auth_token: str) -> Any:
+    """Return a shared Twilio client, rebuilding it if the credentials changed."""
+    global _twilio_client, _twilio_creds
+    if _twilio_client is None or _twilio_creds != (account_sid, auth_token):
+        from twilio.rest import Client
+
+        _twilio_client = Client(account_sid, auth_token)
+        _twilio_creds = (account_sid, auth_token)
+    return _twilio_client
+
+
 def _send_twilio_sms(message: str) -> bool:
     """Fallback SMS via Twilio."""
     try:
-        from twilio.rest import Client
+        import twilio  # noqa: F401
     except ImportError:
         logger.error("Twilio not installed (pip install twilio)")
         return False
@@ -116,7 +139,7 @@ def _send_twilio_sms(message: str) -> bool:
         return False
 
     try:
-        client = Client(account_sid, auth_token)
+        client = _get_twilio_client(account_sid, auth_token)
         client.messages.create(body=message, from_=from_number, to=to_number)
         logger.info("Twilio SMS sent")
         return True
@@ -2,29 +2,42 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
 import logging
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import Callable
+from functools import cache
 from typing import Any
 
 import httpx
 from openai import OpenAI, APIConnectionError, APITimeoutError
+from pydantic import TypeAdapter, ValidationError
 
 logger = logging.getLogger(__name__)
 
-_client: OpenAI | None = None
+# Parses and type-checks structured replies in one pass (built once; reuse is cheap)
+_JSON_OBJECT = TypeAdapter(dict[str, Any])
 
+# summarize() responses, keyed by a digest of the full request; LRU-evicted
+SUMMARY_CACHE_SIZE = 128
+_summary_cache: OrderedDict[bytes, str] = OrderedDict()
+_summary_cache_lock = threading.Lock()
 
+
+@cache
 def get_client(base_url: str = "http://localhost:11434/v1") -> OpenAI:
-    """Get or create the OpenAI client pointed at Ollama."""
-    global _client
-    if _client is None:
-        _client = OpenAI(
-            base_url=base_url,
-            api_key="ollama",
-            timeout=120.0,
-        )
-    return _client
+    """Get or create the OpenAI client pointed at Ollama.
+
+    One client (and so one keep-alive connection pool) per base URL for the
+    life of the process; get_client.cache_clear() drops them.
+    """
+    return OpenAI(
+        base_url=base_url,
+        api_key="ollama",
+        timeout=120.0,
+    )
 
 
 def health_check(base_url: str = "http://localhost:11434") -> bool:
@@ -36,6 +49,42 @@ def health_check(base_url: str = "http://localhost:11434") -> bool:
         return False
 
 
+def _complete(
+    client: OpenAI,
+    on_token: Callable[[str], None] | None,
+    **kwargs: Any,
+) -> str | None:
+    """Run a chat completion, streaming text deltas to on_token if given."""
+    if on_token is None:
+        response = client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+
+    parts: list[str] = []
+    for chunk in client.chat.completions.create(stream=True, **kwargs):
+        if not chunk.choices:
+            continue
+        delta = chunk.choices[0].delta.content
+        if delta:
+            parts.append(delta)
+            on_token(delta)
+    return "".join(parts)
+
+
+def clear_cache() -> None:
+    """Drop all cached summarize() responses."""
+    with _summary_cache_lock:
+        _summary_cache.clear()
+
+
+def _cache_key(*parts: object) -> bytes:
+    """Digest of the request parameters; NUL-separated so fields can't run together."""
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(str(part).encode("utf-8"))
+        h.update(b"\0")
+    return h.digest()
+
+
 def summarize(
     system_prompt: str,
     content: str,
@@ -45,12 +94,33 @@ def summarize(
     temperature: float = 0.3,
     base_url: str = "http://localhost:11434/v1",
     max_retries: int = 2,
+    on_token: Callable[[str], None] | None = None,
 ) -> str | None:
-    """Send a summarization request to Ollama. Returns None on failure."""
+    """Send a summarization request to Ollama. Returns None on failure.
+
+    If on_token is given, the response is streamed and each text delta is
+    passed to it as it arrives; the full text is still returned.
+
+    Successful responses are kept in a small in-process LRU cache, so an
+    identical request (same prompts, model and settings) is answered without
+    calling the model again; a cached answer reaches on_token in one piece.
+    """
+    key = _cache_key(base_url, model, max_tokens, temperature, system_prompt, content)
+    with _summary_cache_lock:
+        cached = _summary_cache.get(key)
+        if cached is not None:
+            _summary_cache.move_to_end(key)
+    if cached is not None:
+        if on_token is not None:
+            on_token(cached)
+        return cached
+
     client = get_client(base_url)
     for attempt in range(max_retries + 1):
         try:
-            response = client.chat.completions.create(
+            text = _complete(
+                client,
+                on_token,
                 model=model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -59,7 +129,13 @@ def summarize(
                 max_completion_tokens=max_tokens,
                 temperature=temperature,
             )
-            return response.choices[0].message.content
+            if text:
+                with _summary_cache_lock:
+                    _summary_cache[key] = text
+                    _summary_cache.move_to_end(key)
+                    while len(_summary_cache) > SUMMARY_CACHE_SIZE:
+                        _summary_cache.popitem(last=False)
+            return text
         except (APIConnectionError, APITimeoutError) as exc:
             if attempt < max_retries:
                 wait = 2 ** attempt
@@ -84,19 +160,24 @@ def chat(
     temperature: float = 0.7,
     base_url: str = "http://localhost:11434/v1",
     max_retries: int = 2,
+    on_token: Callable[[str], None] | None = None,
 ) -> str | None:
-    """Multi-turn chat with Ollama. Returns assistant response or None."""
+    """Multi-turn chat with Ollama. Returns assistant response or None.
+
+    If on_token is given, the response is streamed as in summarize().
+    """
     client = get_client(base_url)
     full_messages = [{"role": "system", "content": system_prompt}] + messages
     for attempt in range(max_retries + 1):
         try:
-            response = client.chat.completions.create(
+            return _complete(
+                client,
+                on_token,
                 model=model,
                 messages=full_messages,
                 max_completion_tokens=max_tokens,
                 temperature=temperature,
             )
-            return response.choices[0].message.content
         except (APIConnectionError, APITimeoutError) as exc:
             if attempt < max_retries:
                 wait = 2 ** attempt
@@ -137,8 +218,8 @@ def structured_output(
                 response_format={"type": "json_object"},
             )
             text = response.choices[0].message.content
-            return json.loads(text)
-        except json.JSONDecodeError as exc:
+            return _JSON_OBJECT.validate_json(text)
+        except ValidationError as exc:
             logger.error("LLM returned invalid JSON: %s", exc)
             return None
         except (APIConnectionError, APITimeoutError) as exc:
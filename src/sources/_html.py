@@ -0,0 +1,26 @@
+"""Reduce feed HTML (summaries, descriptions) to plain text."""
+
+from __future__ import annotations
+
+import html
+
+try:
+    import re2 as _re  # optional: uv sync --extra speedups (linear-time matching)
+except ImportError:
+    import re as _re
+
+# Compiled once; written in the subset re2 accepts (no backreferences)
+_SCRIPT_STYLE = _re.compile(r"(?is)<script\b.*?</script\s*>|<style\b.*?</style\s*>")
+_COMMENT = _re.compile(r"(?s)<!--.*?-->")
+_TAG = _re.compile(r"<[^>]*>")
+_SPACE = _re.compile(r"\s+")
+
+
+def strip_tags(text: str) -> str:
+    """Drop markup, scripts and comments, decode entities and collapse whitespace."""
+    if "<" not in text and "&" not in text:
+        return " ".join(text.split())
+    text = _SCRIPT_STYLE.sub(" ", text)
+    text = _COMMENT.sub(" ", text)
+    text = _TAG.sub(" ", text)
+    return _SPACE.sub(" ", html.unescape(text)).strip()
@@ -0,0 +1,30 @@
+"""Cheap feed-format detection from the first bytes of a document."""
+
+from __future__ import annotations
+
+import re
+from typing import Literal
+
+FeedKind = Literal["atom", "rss", "json", "unknown"]
+
+# Only this much of the document is inspected
+SNIFF_BYTES = 512
+
+# Root elements, optionally namespace-prefixed; RSS 1.0 is an rdf:RDF root
+_RSS_ROOT = re.compile(rb"<(?:rss|(?:[\w.-]+:)?RDF)[\s>]")
+_ATOM_ROOT = re.compile(rb"<(?:[\w.-]+:)?feed[\s>]")
+
+
+def sniff(prefix: bytes) -> FeedKind:
+    """Guess a feed's format from its first bytes.
+
+    "unknown" means no decision; callers should then try every format.
+    """
+    head = prefix[:SNIFF_BYTES].lstrip(b"\xef\xbb\xbf \t\r\n")
+    if head.startswith((b"{", b"[")):
+        return "json"
+    if _RSS_ROOT.search(head):
+        return "rss"
+    if _ATOM_ROOT.search(head):
+        return "atom"
+    return "unknown"
@@ -2,18 +2,49 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 from dataclasses import dataclass
 
 import httpx
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://export.arxiv.org/api/query"
 TIMEOUT = 30.0
 
+# Shared connection pool: keep-alive reuse across the agent's searches
+_client = httpx.Client(
+    timeout=TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
 
-@dataclass
+
+def close() -> None:
+    """Close the shared HTTP client."""
+    _client.close()
+
+
+atexit.register(close)
+
+NS = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+
+# Hardened parser: no entity expansion, no network fetches for DTDs
+_PARSER = etree.XMLParser(resolve_entities=False, no_network=True)
+
+# Entry field extractors, compiled once at import
+_X_ENTRIES = etree.XPath("atom:entry", namespaces=NS)
+_X_ID = etree.XPath("string(atom:id)", namespaces=NS)
+_X_TITLE = etree.XPath("string(atom:title)", namespaces=NS)
+_X_SUMMARY = etree.XPath("string(atom:summary)", namespaces=NS)
+_X_PUBLISHED = etree.XPath("string(atom:published)", namespaces=NS)
+_X_AUTHORS = etree.XPath("atom:author/atom:name/text()", namespaces=NS)
+_X_CATS = etree.XPath("atom:category/@term", namespaces=NS)
+_X_LINK = etree.XPath("atom:link[@type='text/html']/@href", namespaces=NS)
+
+
+@dataclass(slots=True, frozen=True)
 class ArxivPaper:
     arxiv_id: str
     title: str
@@ -44,7 +75,7 @@ def search(
     }
 
     try:
-        resp = httpx.get(BASE_URL, params=params, timeout=TIMEOUT)
+        resp = _client.get(BASE_URL, params=params)
         resp.raise_for_status()
         return _parse_atom(resp.text)
     except Exception as exc:
@@ -54,47 +85,29 @@ def search(
 
 def _parse_atom(xml_text: str) -> list[ArxivPaper]:
     """Parse arXiv Atom XML response."""
-    import xml.etree.ElementTree as ET
-    from defusedxml.ElementTree import fromstring as safe_fromstring
-
-    ns = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
     papers = []
 
     try:
-        root = safe_fromstring(xml_text)
-    except ET.ParseError as exc:
+        root = etree.fromstring(xml_text.encode("utf-8"), parser=_PARSER)
+    except etree.XMLSyntaxError as exc:
         logger.error("arXiv XML parse error: %s", exc)
         return []
 
-    for entry in root.findall("atom:entry", ns):
+    for entry in _X_ENTRIES(root):
         try:
-            arxiv_id = entry.findtext("atom:id", "", ns).split("/abs/")[-1]
-            title = entry.findtext("atom:title", "", ns).replace("\n", " ").strip()
-            abstract = entry.findtext("atom:summary", "", ns).strip()[:2000]
-            published = entry.findtext("atom:published", "", ns)[:10]
-
-            authors = []
-            for author in entry.findall("atom:author", ns):
-                name = author.findtext("atom:name", "", ns)
-                if name:
-                    authors.append(name)
+            arxiv_id = _X_ID(entry).split("/abs/")[-1]
+            title = _X_TITLE(entry).replace("\n", " ").strip()
+            abstract = _X_SUMMARY(entry).strip()[:2000]
+            published = _X_PUBLISHED(entry)[:10]
+
+            authors = [name for name in _X_AUTHORS(entry) if name]
             authors_str = ", ".join(authors[:3])
             if len(authors) > 3:
                 authors_str += " et al."
 
-            categories = []
-            for cat in entry.findall("atom:category", ns):
-                term = cat.get("term", "")
-                if term:
-                    categories.append(term)
-
-            link = ""
-            for link_el in entry.findall("atom:link", ns):
-                if link_el.get("type") == "text/html":
-                    link = link_el.get("href", "")
-                    break
-            if not link:
-                link = f"https://arxiv.org/abs/{arxiv_id}"
+            categories = [term for term in _X_CATS(entry) if term]
+
+            link = next(iter(_X_LINK(entry)), "") or f"https://arxiv.org/abs/{arxiv_id}"
 
             papers.append(ArxivPaper(
                 arxiv_id=arxiv_id,
@@ -12,7 +12,7 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://connect.biorxiv.org/biorxiv_xml.php"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class BiorxivPaper:
     doi: str
     title: str
@@ -26,7 +26,8 @@ def fetch(subject: str = "bioinformatics", max_results: int = 20) -> list[Biorxi
     """Fetch recent bioRxiv papers from RSS feed."""
     url = f"{BASE_URL}?subject={subject}"
     try:
-        feed = feedparser.parse(url)
+        # Abstracts are only fed to the LLM, so skip feedparser's HTML rewriting
+        feed = feedparser.parse(url, resolve_relative_uris=False, sanitize_html=False)
         if feed.bozo and not feed.entries:
             logger.error("bioRxiv feed parse error: %s", feed.bozo_exception)
             return []
@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import subprocess
+import tempfile
+import threading
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import IO
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 # Use the existing AppleScript from llm-actions
 APPLESCRIPT_PATH = Path.home() / "GitHub" / "llm-actions" / "scripts" / "read_inbox_ai_safe.applescript"
+TIMEOUT = 60.0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class EmailMessage:
     from_addr: str
     subject: str
@@ -30,45 +36,91 @@ def read_label(label: str = "AI-REVIEW", max_items: int = 20) -> list[EmailMessa
     Uses the existing read_inbox_ai_safe.applescript, passing max_items as input.
     The script reads from a hardcoded label; for different labels, we'd need to
     modify the AppleScript or use a parameterized version.
+
+    Output is parsed as it streams in: a script that prints one JSON object
+    per line (NDJSON) is read incrementally and stopped once max_items are in;
+    the single JSON array the stock script prints is still accepted.
     """
     if not APPLESCRIPT_PATH.exists():
         logger.error("AppleScript not found: %s", APPLESCRIPT_PATH)
         return []
 
+    # stderr goes to a file, not a pipe nobody reads while stdout streams:
+    # a chatty script (AppleScript `log`) would otherwise fill the pipe and block
+    stderr = tempfile.TemporaryFile()
     try:
-        result = subprocess.run(
+        proc = subprocess.Popen(
             ["osascript", str(APPLESCRIPT_PATH), str(max_items)],
-            capture_output=True,
-            text=True,
-            timeout=60,
+            stdout=subprocess.PIPE,
+            stderr=stderr,
         )
-        if result.returncode != 0:
-            logger.error("AppleScript error: %s", result.stderr)
-            return []
+    except Exception as exc:
+        stderr.close()
+        logger.error("Gmail read failed: %s", exc)
+        return []
 
-        output = result.stdout.strip()
-        if not output or output == "[]":
-            return []
+    timed_out = threading.Event()
 
-        emails_data = json.loads(output)
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(TIMEOUT, _kill)
+    timer.start()
+    try:
         messages = []
-        for item in emails_data:
-            msg_id = f"{item.get('from', '')}:{item.get('subject', '')}:{item.get('date', '')}"
-            messages.append(EmailMessage(
-                from_addr=item.get("from", ""),
-                subject=item.get("subject", ""),
-                date=item.get("date", ""),
-                body=item.get("body", "")[:3000],  # Truncate for LLM
-                attachments=item.get("attachments", ""),
-                message_id=msg_id,
-            ))
+        for item in _iter_records(proc.stdout):
+            messages.append(_to_message(item))
+            if len(messages) >= max_items:
+                return messages
+
+        proc.wait()
+        if timed_out.is_set():
+            logger.error("AppleScript timed out reading Gmail")
+            return []
+        if proc.returncode != 0:
+            stderr.seek(0)
+            logger.error("AppleScript error: %s", stderr.read().decode(errors="replace"))
+            return []
         return messages
-    except subprocess.TimeoutExpired:
-        logger.error("AppleScript timed out reading Gmail")
-        return []
-    except json.JSONDecodeError as exc:
-        logger.error("Failed to parse AppleScript output as JSON: %s", exc)
+    except orjson.JSONDecodeError as exc:
+        if timed_out.is_set():
+            logger.error("AppleScript timed out reading Gmail")
+        else:
+            logger.error("Failed to parse AppleScript output as JSON: %s", exc)
         return []
     except Exception as exc:
         logger.error("Gmail read failed: %s", exc)
         return []
+    finally:
+        timer.cancel()
+        if proc.poll() is None:
+            proc.kill()
+        proc.wait()
+        proc.stdout.close()
+        stderr.close()
+
+
+def _iter_records(stream: IO[bytes]) -> Iterator[dict]:
+    """Yield email dicts from NDJSON lines, or from a single JSON array."""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith(b"["):
+            # Array output needs the whole document before it can be parsed
+            yield from orjson.loads(line + stream.read())
+            return
+        yield orjson.loads(line)
+
+
+def _to_message(item: dict) -> EmailMessage:
+    msg_id = f"{item.get('from', '')}:{item.get('subject', '')}:{item.get('date', '')}"
+    return EmailMessage(
+        from_addr=item.get("from", ""),
+        subject=item.get("subject", ""),
+        date=item.get("date", ""),
+        body=item.get("body", "")[:3000],  # Truncate for LLM
+        attachments=item.get("attachments", ""),
+        message_id=msg_id,
+    )
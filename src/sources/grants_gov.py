@@ -3,16 +3,28 @@
 from __future__ import annotations
 
 import logging
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 
-import feedparser
+from src.sources import rss
+from src.sources._html import strip_tags
+
+try:
+    import ahocorasick  # optional: uv sync --extra speedups
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
 RSS_URL = "https://www.grants.gov/rss/GG_NewOppByCategory.xml"
 
+# Below this many keywords one regex is as quick as building an automaton
+_AUTOMATON_MIN_KEYWORDS = 4
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class GrantsGovOpportunity:
     opportunity_id: str
     title: str
@@ -22,6 +34,26 @@ class GrantsGovOpportunity:
     description: str
 
 
+@lru_cache(maxsize=32)
+def _keyword_matcher(keywords: tuple[str, ...]) -> Callable[[str], bool] | None:
+    """Case-insensitive "contains any keyword" test, built once per keyword set.
+
+    Uses an Aho-Corasick automaton (one pass per text whatever the number of
+    keywords) when pyahocorasick is installed and the list is long enough to
+    benefit; otherwise a single escaped regex alternation.
+    """
+    if not keywords:
+        return None
+    if ahocorasick is not None and len(keywords) >= _AUTOMATON_MIN_KEYWORDS:
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw.lower(), kw)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text.lower()), None) is not None
+    pattern = re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+    return lambda text: pattern.search(text) is not None
+
+
 def search(
     keywords: list[str] | None = None,
     categories: list[str] | None = None,
@@ -29,21 +61,16 @@ def search(
 ) -> list[GrantsGovOpportunity]:
     """Fetch and filter opportunities from Grants.gov RSS feed."""
     try:
-        feed = feedparser.parse(RSS_URL)
-        if feed.bozo and not feed.entries:
-            logger.error("Grants.gov feed parse error: %s", feed.bozo_exception)
-            return []
-
+        resp = rss.download(RSS_URL)
         opportunities = []
-        keywords_lower = [k.lower() for k in (keywords or [])]
+        matches = _keyword_matcher(tuple(sorted({k for k in keywords or [] if k})))
 
-        for entry in feed.entries:
+        # Entries are pulled lazily, so parsing stops once max_results match
+        for entry in rss.iter_entries(resp):
             title = entry.get("title", "")
-            description = entry.get("summary", "")
-            combined = f"{title} {description}".lower()
-
+            description = strip_tags(entry.get("summary", ""))
             # Filter by keywords if provided
-            if keywords_lower and not any(kw in combined for kw in keywords_lower):
+            if matches and not matches(f"{title} {description}"):
                 continue
 
             opp_id = entry.get("id", entry.get("link", ""))
@@ -54,7 +81,7 @@ def search(
                 opportunity_id=opp_id,
                 title=title.strip(),
                 agency=entry.get("author", ""),
-                deadline=deadline[:25],
+                deadline=rss.normalize_date(deadline)[:25],
                 url=link,
                 description=description[:1500],
             ))
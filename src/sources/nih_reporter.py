@@ -2,18 +2,34 @@
 
 from __future__ import annotations
 
+import atexit
 import logging
 from dataclasses import dataclass
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.reporter.nih.gov/v2/projects/search"
 TIMEOUT = 30.0
 
+# Shared connection pool: keep-alive reuse instead of a TCP+TLS handshake per call
+_client = httpx.Client(
+    timeout=TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
 
-@dataclass
+
+def close() -> None:
+    """Close the shared HTTP client."""
+    _client.close()
+
+
+atexit.register(close)
+
+
+@dataclass(slots=True, frozen=True)
 class NIHOpportunity:
     foa_number: str
     title: str
@@ -52,9 +68,13 @@ def search(
         criteria["agency_ic_admin"] = {"include_values": ic_codes}
 
     try:
-        resp = httpx.post(BASE_URL, json={"criteria": criteria}, timeout=TIMEOUT)
+        resp = _client.post(
+            BASE_URL,
+            content=orjson.dumps({"criteria": criteria}),
+            headers={"Content-Type": "application/json"},
+        )
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         return _parse_results(data)
     except Exception as exc:
         logger.error("NIH RePORTER search failed: %s", exc)
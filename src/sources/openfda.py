@@ -8,18 +8,42 @@ API docs: https://open.fda.gov/apis/drug/label/
 
 from __future__ import annotations
 
+import atexit
 import logging
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://api.fda.gov/drug/label.json"
 TIMEOUT = 15.0
 
-# Common drug abbreviations → FDA generic names (unambiguous only)
-DRUG_ABBREVIATIONS: dict[str, str] = {
+# Shared connection pool: the fallback search strategies below reuse one
+# TLS connection instead of paying a handshake each
+_client = httpx.Client(
+    timeout=TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
+
+def close() -> None:
+    """Close the shared HTTP client."""
+    _client.close()
+
+
+atexit.register(close)
+
+# Runs the SEARCH_FIELDS lookups side by side on the shared client
+_search_pool = ThreadPoolExecutor(max_workers=3, thread_name_prefix="openfda")
+
+# Common drug abbreviations → FDA generic names (unambiguous only); read-only
+DRUG_ABBREVIATIONS: Mapping[str, str] = MappingProxyType({
     "hctz": "hydrochlorothiazide",
     "apap": "acetaminophen",
     "asa": "aspirin",
@@ -34,10 +58,13 @@ DRUG_ABBREVIATIONS: dict[str, str] = {
     "mmf": "mycophenolate mofetil",
     "epi": "epinephrine",
     "ntg": "nitroglycerin",
-}
+})
+
+# Label fields searched in order until one returns results
+SEARCH_FIELDS = ("openfda.brand_name", "openfda.generic_name", "openfda.substance_name")
 
 # Sections to extract from prescription drug labels
-RX_SECTIONS = [
+RX_SECTIONS = (
     "indications_and_usage",
     "dosage_and_administration",
     "contraindications",
@@ -50,10 +77,10 @@ RX_SECTIONS = [
     "pregnancy",
     "geriatric_use",
     "pediatric_use",
-]
+)
 
 # OTC labels use different section names
-OTC_SECTIONS = [
+OTC_SECTIONS = (
     "indications_and_usage",
     "dosage_and_administration",
     "active_ingredient",
@@ -66,13 +93,14 @@ OTC_SECTIONS = [
     "pregnancy_or_breast_feeding",
     "keep_out_of_reach_of_children",
     "overdosage",
-]
+)
 
 
-@dataclass
+@dataclass(slots=True)
 class DrugLabel:
     brand_name: str
     generic_name: str
+    # Only the sections present on the label, keyed by openFDA field name
     sections: dict[str, str] = field(default_factory=dict)
 
 
@@ -111,35 +139,42 @@ def search_drug_options(name: str, limit: int = 5) -> list[DrugLabel]:
     # Resolve abbreviations before searching
     name = DRUG_ABBREVIATIONS.get(name.lower().strip(), name)
 
-    search_strategies = [
-        f'openfda.brand_name:"{name}"',
-        f'openfda.generic_name:"{name}"',
-        f'openfda.substance_name:"{name}"',
+    # All strategies are in flight at once, but results are taken in priority
+    # order so the answer matches a sequential brand → generic → substance search
+    futures = [
+        _search_pool.submit(_search_field, search_field, name, limit)
+        for search_field in SEARCH_FIELDS
     ]
-
-    for search_query in search_strategies:
-        try:
-            resp = httpx.get(
-                BASE_URL,
-                params={"search": search_query, "limit": limit},
-                timeout=TIMEOUT,
-            )
-            if resp.status_code == 404:
+    try:
+        for future in futures:
+            try:
+                results = future.result()
+            except httpx.HTTPStatusError:
                 continue
-            resp.raise_for_status()
-            data = resp.json()
-            results = data.get("results", [])
+            except Exception as exc:
+                logger.error("openFDA search failed for '%s': %s", name, exc)
+                return []
             if results:
                 return _deduplicate([_parse_label(r) for r in results])
-        except httpx.HTTPStatusError:
-            continue
-        except Exception as exc:
-            logger.error("openFDA search failed for '%s': %s", name, exc)
-            return []
+        return []
+    finally:
+        for future in futures:
+            future.cancel()
+
 
-    return []
+def _search_field(search_field: str, name: str, limit: int) -> list[dict]:
+    """Query one label field; a 404 (no match) yields an empty list."""
+    resp = _client.get(
+        BASE_URL,
+        params={"search": f'{search_field}:"{name}"', "limit": limit},
+    )
+    if resp.status_code == 404:
+        return []
+    resp.raise_for_status()
+    return orjson.loads(resp.content).get("results", [])
 
 
+@lru_cache(maxsize=1024)
 def _normalize_generic(name: str) -> str:
     """Normalize generic name for dedup: uppercase, hyphens → AND."""
     return name.upper().strip().replace("-", " AND ").replace("  ", " ")
@@ -151,17 +186,15 @@ def _deduplicate(labels: list[DrugLabel]) -> list[DrugLabel]:
     Keeps the first occurrence of each unique generic name.
     Sorts single-ingredient products before combinations.
     """
-    seen: set[str] = set()
-    unique: list[DrugLabel] = []
+    # Normalize each name once; dict insertion order keeps the first label per key
+    unique: dict[str, DrugLabel] = {}
     for label in labels:
         key = _normalize_generic(label.generic_name)
-        if key and key not in seen:
-            seen.add(key)
-            unique.append(label)
+        if key:
+            unique.setdefault(key, label)
 
     # Sort: single-ingredient first (no "AND" in normalized name)
-    unique.sort(key=lambda label: " AND " in _normalize_generic(label.generic_name))
-    return unique
+    return [label for key, label in sorted(unique.items(), key=lambda kv: " AND " in kv[0])]
 
 
 def _parse_label(result: dict) -> DrugLabel:
@@ -8,20 +8,61 @@ Set PUBMED_API_KEY env var to use higher limit.
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cache
+from itertools import islice
 
 import httpx
+import orjson
+from lxml import etree
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://eutils.ncbi.nlm.nih.gov/entrez/eutils"
 TIMEOUT = 30.0
+# E-utilities accepts up to 200 ids per efetch request
+EFETCH_BATCH = 200
 
-# Track last request time for rate limiting
-_last_request_time: float = 0.0
+# Shared connection pool: keep-alive reuse instead of a TCP+TLS handshake per call
+_client = httpx.Client(
+    base_url=BASE_URL,
+    timeout=TIMEOUT,
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
+# Article field extractors, compiled once at import. Plain-str results
+# (smart_strings=False) so parsed values don't pin the freed elements.
+_X_PMID = etree.XPath("string(MedlineCitation/PMID)", smart_strings=False)
+_X_ARTICLE = etree.XPath("MedlineCitation/Article")
+# Relative to <Article>
+_X_TITLE = etree.XPath("string(ArticleTitle)", smart_strings=False)
+_X_AUTHORS = etree.XPath("AuthorList/Author[LastName != '']")
+_X_LAST_NAME = etree.XPath("string(LastName)", smart_strings=False)
+_X_INITIALS = etree.XPath("string(Initials)", smart_strings=False)
+_X_ABSTRACT = etree.XPath("Abstract/AbstractText")
+_X_TEXT = etree.XPath("string()", smart_strings=False)
+_X_JOURNAL = etree.XPath("string(Journal/Title)", smart_strings=False)
+_X_YEAR = etree.XPath("string((Journal//PubDate)[1]/Year)", smart_strings=False)
+_X_MONTH = etree.XPath("string((Journal//PubDate)[1]/Month)", smart_strings=False)
+
+# Rate limiting: next monotonic time a request may start, shared by all threads
+_rate_lock = threading.Lock()
+_next_slot: float = 0.0
+
+
+def close() -> None:
+    """Close the shared HTTP client."""
+    _client.close()
+
+
+atexit.register(close)
 
 
 def _get_api_params() -> dict:
@@ -30,18 +71,30 @@ def _get_api_params() -> dict:
     return {"api_key": key} if key else {}
 
 
-def _rate_limit() -> None:
-    """Enforce rate limiting between requests."""
-    global _last_request_time
-    key = os.environ.get("PUBMED_API_KEY", "")
-    min_interval = 0.11 if key else 0.35  # 10/sec with key, ~3/sec without
-    elapsed = time.monotonic() - _last_request_time
-    if elapsed < min_interval:
-        time.sleep(min_interval - elapsed)
-    _last_request_time = time.monotonic()
+@cache
+def _min_interval() -> float:
+    """Seconds between requests: 10/sec with an API key, ~3/sec without.
 
+    Read on first use rather than at import, so a .env loaded by the
+    entry-point scripts after importing the agents is still honoured.
+    """
+    return 0.11 if os.environ.get("PUBMED_API_KEY") else 0.35
 
-@dataclass
+
+def _rate_limit() -> None:
+    """Block until this caller's request slot comes up (thread-safe)."""
+    global _next_slot
+    interval = _min_interval()
+    with _rate_lock:
+        now = time.monotonic()
+        wait = max(0.0, _next_slot - now)
+        _next_slot = max(now, _next_slot) + interval
+    # Sleep outside the lock: the slot is already reserved
+    if wait:
+        time.sleep(wait)
+
+
+@dataclass(slots=True, frozen=True)
 class PubMedArticle:
     pmid: str
     title: str
@@ -66,9 +119,9 @@ def search(query: str, max_results: int = 20) -> list[str]:
         **_get_api_params(),
     }
     try:
-        resp = httpx.get(f"{BASE_URL}/esearch.fcgi", params=params, timeout=TIMEOUT)
+        resp = _client.get("/esearch.fcgi", params=params)
         resp.raise_for_status()
-        data = resp.json()
+        data = orjson.loads(resp.content)
         return data.get("esearchresult", {}).get("idlist", [])
     except Exception as exc:
         logger.error("PubMed search failed: %s", exc)
@@ -77,92 +130,124 @@ def search(query: str, max_results: int = 20) -> list[str]:
 
 def fetch_details(pmids: list[str]) -> list[PubMedArticle]:
     """Fetch article details for a list of PMIDs."""
-    if not pmids:
-        return []
+    return efetch_many(pmids)
+
+
+def efetch_many(ids: list[str], chunk: int = EFETCH_BATCH) -> list[PubMedArticle]:
+    """Fetch many PMIDs with one efetch request per chunk of ids.
+
+    Ids are POSTed so long lists don't run into URL length limits, and each
+    multi-article response is parsed as it streams in. A failed chunk is
+    logged and skipped; articles from the other chunks are still returned.
+    """
+    articles: list[PubMedArticle] = []
+    for i in range(0, len(ids), chunk):
+        _rate_limit()
+        data = {
+            "db": "pubmed",
+            "id": ",".join(ids[i:i + chunk]),
+            "retmode": "xml",
+            "rettype": "abstract",
+            **_get_api_params(),
+        }
+        try:
+            with _client.stream("POST", "/efetch.fcgi", data=data) as resp:
+                resp.raise_for_status()
+                articles.extend(_iter_xml(resp.iter_bytes()))
+        except Exception as exc:
+            logger.error("PubMed fetch failed: %s", exc)
+    return articles
 
-    _rate_limit()
-    params = {
-        "db": "pubmed",
-        "id": ",".join(pmids),
-        "retmode": "xml",
-        "rettype": "abstract",
-        **_get_api_params(),
-    }
-    try:
-        resp = httpx.get(f"{BASE_URL}/efetch.fcgi", params=params, timeout=TIMEOUT)
-        resp.raise_for_status()
-        return _parse_xml(resp.text)
-    except Exception as exc:
-        logger.error("PubMed fetch failed: %s", exc)
-        return []
+
+def _parse_xml(xml: str | bytes | Iterable[bytes]) -> list[PubMedArticle]:
+    """Parse PubMed XML (text, bytes or a stream of byte chunks) into article objects."""
+    return list(_iter_xml(xml))
 
 
-def _parse_xml(xml_text: str) -> list[PubMedArticle]:
-    """Parse PubMed XML response into article objects."""
-    import xml.etree.ElementTree as ET
-    from defusedxml.ElementTree import fromstring as safe_fromstring
+def _iter_xml(xml: str | bytes | Iterable[bytes]) -> Iterator[PubMedArticle]:
+    """Yield articles from PubMed XML as each <PubmedArticle> closes.
 
-    articles = []
+    Elements are freed once converted, so memory stays flat however large
+    the efetch batch is, and a caller that stops early stops the parse.
+    """
+    parser = etree.XMLPullParser(
+        events=("end",), tag="PubmedArticle", resolve_entities=False, no_network=True,
+    )
+    if isinstance(xml, str):
+        # libxml2 consumes bytes; encode once here rather than per feed
+        xml = xml.encode("utf-8")
     try:
-        root = safe_fromstring(xml_text)
-    except ET.ParseError as exc:
+        for chunk in [xml] if isinstance(xml, bytes) else xml:
+            parser.feed(chunk)
+            yield from _read_articles(parser)
+        parser.close()
+        yield from _read_articles(parser)
+    except etree.XMLSyntaxError as exc:
         logger.error("PubMed XML parse error: %s", exc)
-        return []
 
-    for article_el in root.findall(".//PubmedArticle"):
-        try:
-            medline = article_el.find("MedlineCitation")
-            pmid = medline.findtext("PMID", "")
-            art = medline.find("Article")
-            title = art.findtext("ArticleTitle", "")
-
-            # Authors
-            author_list = art.find("AuthorList")
-            authors = []
-            if author_list is not None:
-                for author in author_list.findall("Author"):
-                    last = author.findtext("LastName", "")
-                    initials = author.findtext("Initials", "")
-                    if last:
-                        authors.append(f"{last} {initials}".strip())
-            authors_str = ", ".join(authors[:3])
-            if len(authors) > 3:
-                authors_str += " et al."
-
-            # Abstract
-            abstract_el = art.find("Abstract")
-            abstract = ""
-            if abstract_el is not None:
-                parts = [t.text or "" for t in abstract_el.findall("AbstractText")]
-                abstract = " ".join(parts)
-
-            # Source and date
-            journal = art.find("Journal")
-            source = journal.findtext("Title", "") if journal is not None else ""
-            pub_date_el = journal.find(".//PubDate") if journal is not None else None
-            pub_date = ""
-            if pub_date_el is not None:
-                year = pub_date_el.findtext("Year", "")
-                month = pub_date_el.findtext("Month", "")
-                pub_date = f"{year} {month}".strip()
-
-            articles.append(PubMedArticle(
-                pmid=pmid,
-                title=title,
-                authors=authors_str,
-                abstract=abstract[:2000],  # Truncate for LLM context
-                source=source,
-                pub_date=pub_date,
-                url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
-            ))
-        except Exception as exc:
-            logger.warning("Failed to parse PubMed article: %s", exc)
-            continue
 
-    return articles
+def _read_articles(parser: etree.XMLPullParser) -> Iterator[PubMedArticle]:
+    """Convert the articles completed so far, releasing their elements."""
+    for _, article_el in parser.read_events():
+        article = _parse_article(article_el)
+        if article is not None:
+            yield article
+        article_el.clear()
+        while article_el.getprevious() is not None:
+            del article_el.getparent()[0]
+
+
+def _parse_article(article_el: etree._Element) -> PubMedArticle | None:
+    """Build a PubMedArticle from a <PubmedArticle> element."""
+    try:
+        pmid = _X_PMID(article_el)
+        art = _X_ARTICLE(article_el)[0]
+        title = _X_TITLE(art)
+
+        # Authors: only the first three are shown, so stop after a fourth
+        # (which just signals "et al.") instead of formatting the whole list
+        named = (f"{_X_LAST_NAME(a)} {_X_INITIALS(a)}".strip() for a in _X_AUTHORS(art))
+        authors = list(islice(named, 4))
+        authors_str = ", ".join(authors[:3])
+        if len(authors) > 3:
+            authors_str += " et al."
+
+        # Abstract (structured abstracts have one AbstractText per section)
+        abstract = " ".join(text for t in _X_ABSTRACT(art) if (text := _X_TEXT(t)))
+
+        # Source and date
+        source = _X_JOURNAL(art)
+        pub_date = f"{_X_YEAR(art)} {_X_MONTH(art)}".strip()
+
+        return PubMedArticle(
+            pmid=pmid,
+            title=title,
+            authors=authors_str,
+            abstract=abstract[:2000],  # Truncate for LLM context
+            source=source,
+            pub_date=pub_date,
+            url=f"https://pubmed.ncbi.nlm.nih.gov/{pmid}/",
+        )
+    except Exception as exc:
+        logger.warning("Failed to parse PubMed article: %s", exc)
+        return None
 
 
 def search_and_fetch(query: str, max_results: int = 20) -> list[PubMedArticle]:
     """Search and fetch articles in one call."""
     pmids = search(query, max_results)
     return fetch_details(pmids)
+
+
+def search_and_fetch_many(queries: list[str], max_per_query: int = 20) -> list[PubMedArticle]:
+    """Run several searches concurrently, then fetch every hit in one efetch call.
+
+    PMIDs are de-duplicated across queries, keeping first-seen order. The
+    shared rate limiter still spaces out the individual esearch requests.
+    """
+    if not queries:
+        return []
+    with ThreadPoolExecutor(max_workers=min(3, len(queries))) as pool:
+        results = pool.map(lambda q: search(q, max_per_query), queries)
+        pmids = list(dict.fromkeys(pmid for idlist in results for pmid in idlist))
+    return fetch_details(pmids)
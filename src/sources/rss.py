@@ -2,15 +2,85 @@
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
-from dataclasses import dataclass
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any
+from urllib.parse import urljoin
 
 import feedparser
+import httpx
+from lxml import etree
+
+from src.sources._html import strip_tags
+from src.sources._sniff import sniff
 
 logger = logging.getLogger(__name__)
 
+TIMEOUT = 30.0
+FEED_CACHE_FILE = Path(__file__).parent.parent.parent / "data" / "feed_cache.json"
+
+# Shared connection pool for feed downloads (also used by fetch_multiple's threads)
+_client = httpx.Client(
+    timeout=TIMEOUT,
+    follow_redirects=True,
+    headers={"User-Agent": feedparser.USER_AGENT},
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+)
+
+
+def close() -> None:
+    """Close the shared HTTP client."""
+    _client.close()
+
+
+atexit.register(close)
+
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_RSS1 = "{http://purl.org/rss/1.0/}"
+_DC = "{http://purl.org/dc/elements/1.1/}"
+_CONTENT = "{http://purl.org/rss/1.0/modules/content/}"
 
-@dataclass
+# Entry elements for RSS 2.0, RSS 1.0 (RDF) and Atom
+_ENTRY_TAGS = ("item", f"{_RSS1}item", f"{_ATOM}entry")
+_CHANNEL_TAGS = ("channel", f"{_RSS1}channel", f"{_ATOM}feed")
+_TITLE_TAGS = ("title", f"{_RSS1}title", f"{_ATOM}title")
+_ENTRY_TAGS_BY_KIND = {"rss": ("item", f"{_RSS1}item"), "atom": (f"{_ATOM}entry",)}
+
+# Child element -> feedparser-style entry key, for the fast path
+_ENTRY_FIELDS = {
+    "title": "title",
+    f"{_RSS1}title": "title",
+    f"{_ATOM}title": "title",
+    "link": "link",
+    f"{_RSS1}link": "link",
+    "description": "summary",
+    f"{_RSS1}description": "summary",
+    f"{_ATOM}summary": "summary",
+    f"{_CONTENT}encoded": "content",
+    f"{_ATOM}content": "content",
+    "pubDate": "published",
+    f"{_ATOM}published": "published",
+    f"{_DC}date": "published",
+    f"{_ATOM}updated": "updated",
+    "guid": "id",
+    f"{_ATOM}id": "id",
+    "author": "author",
+    f"{_DC}creator": "author",
+    f"{_ATOM}author": "author",
+}
+
+
+@dataclass(slots=True, frozen=True)
 class FeedItem:
     title: str
     url: str
@@ -19,36 +89,305 @@ class FeedItem:
     published: str
 
 
+# Conditional-GET cache: url -> {"etag", "last_modified", "title", "max_items",
+# "items": [FeedItem dicts]}. max_items is how many entries were read, so a
+# caller asking for more than that refetches instead of getting a short list.
+# Least recently used URLs are evicted past FEED_CACHE_SIZE, so one-off feeds
+# (e.g. ad-hoc search URLs) don't pile up in memory and on disk.
+FEED_CACHE_SIZE = 256
+_feed_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_feed_cache_lock = threading.Lock()
+_feed_cache_loaded = False
+_feed_cache_dirty = False
+
+
 def fetch_feed(url: str, source_name: str = "", max_items: int = 20) -> list[FeedItem]:
-    """Parse an RSS/Atom feed and return items."""
+    """Parse an RSS/Atom feed and return items.
+
+    Sends If-None-Match / If-Modified-Since from the last response; on
+    304 Not Modified the cached items are returned without re-parsing.
+    """
+    global _feed_cache_dirty
     try:
-        feed = feedparser.parse(url)
-        if feed.bozo and not feed.entries:
-            logger.error("Feed parse error for %s: %s", url, feed.bozo_exception)
-            return []
-
-        source = source_name or feed.feed.get("title", url)
-        items = []
-        for entry in feed.entries[:max_items]:
-            items.append(FeedItem(
-                title=entry.get("title", "").strip(),
-                url=entry.get("link", ""),
-                source=source,
-                summary=entry.get("summary", "")[:1000],
-                published=entry.get("published", entry.get("updated", ""))[:25],
-            ))
-        return items
+        with _feed_cache_lock:
+            cached = _feed_cache.get(url)
+            if cached:
+                _feed_cache.move_to_end(url)
+        # Read enough entries for every caller seen so far, so callers with
+        # different limits don't keep replacing each other's cache entry
+        limit = max(max_items, cached.get("max_items", 0) if cached else 0)
+        if cached and cached.get("max_items", 0) < max_items:
+            cached = None  # Too short for this caller; do a full fetch
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+
+        # Streamed: entries are parsed as bytes arrive, and once enough are
+        # in the connection is dropped instead of reading the rest
+        with _client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304:
+                if not cached:
+                    return []
+                source = source_name or cached.get("title") or url
+                return [
+                    FeedItem(**{**item, "source": source}) for item in cached["items"][:max_items]
+                ]
+            resp.raise_for_status()
+
+            stream = FeedStream(resp.iter_bytes(), str(resp.url), resp.headers)
+            items = []
+            for entry in islice(stream.entries(), limit):
+                items.append(FeedItem(
+                    title=entry.get("title", "").strip(),
+                    url=entry.get("link", ""),
+                    source=source_name or stream.title or url,
+                    summary=strip_tags(entry.get("summary", ""))[:1000],
+                    published=normalize_date(entry.get("published", entry.get("updated", "")))[:25],
+                ))
+
+        etag = resp.headers.get("ETag", "")
+        last_modified = resp.headers.get("Last-Modified", "")
+        if etag or last_modified:
+            with _feed_cache_lock:
+                _feed_cache[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "title": stream.title,
+                    "max_items": limit,
+                    "items": [asdict(item) for item in items],
+                }
+                _feed_cache.move_to_end(url)
+                while len(_feed_cache) > FEED_CACHE_SIZE:
+                    _feed_cache.popitem(last=False)
+                _feed_cache_dirty = True
+        return items[:max_items]
     except Exception as exc:
         logger.error("Feed fetch failed for %s: %s", url, exc)
         return []
 
 
-def fetch_multiple(feeds: list[dict], max_per_feed: int = 10) -> list[FeedItem]:
-    """Fetch multiple feeds. Each dict should have 'url' and optionally 'name'."""
-    all_items = []
-    for feed_conf in feeds:
-        url = feed_conf.get("url", "")
-        name = feed_conf.get("name", "")
-        if url:
-            all_items.extend(fetch_feed(url, name, max_per_feed))
+def download(url: str) -> httpx.Response:
+    """GET a feed over the shared client. Raises httpx.HTTPError on failure."""
+    resp = _client.get(url)
+    resp.raise_for_status()
+    return resp
+
+
+def load_cache(path: Path | None = None) -> None:
+    """Load the conditional-GET cache from disk (once per process)."""
+    global _feed_cache_loaded
+    if _feed_cache_loaded:
+        return
+    _feed_cache_loaded = True
+    path = path or FEED_CACHE_FILE
+    if not path.exists():
+        return
+    try:
+        _feed_cache.update(json.loads(path.read_text(encoding="utf-8")))
+        while len(_feed_cache) > FEED_CACHE_SIZE:
+            _feed_cache.popitem(last=False)
+    except (json.JSONDecodeError, OSError) as exc:
+        logger.warning("Failed to load feed cache, starting fresh: %s", exc)
+
+
+def save_cache(path: Path | None = None) -> None:
+    """Write the conditional-GET cache to disk if it changed."""
+    global _feed_cache_dirty
+    if not _feed_cache_dirty:
+        return
+    path = path or FEED_CACHE_FILE
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        with _feed_cache_lock:
+            data = json.dumps(_feed_cache)
+        tmp.write_text(data, encoding="utf-8")
+        tmp.rename(path)  # Atomic on same filesystem
+        _feed_cache_dirty = False
+    except OSError as exc:
+        logger.warning("Failed to save feed cache: %s", exc)
+
+
+def iter_entries(resp: httpx.Response) -> Iterator[Mapping[str, Any]]:
+    """Yield a downloaded feed's entries as mappings with feedparser-style keys.
+
+    See FeedStream; callers that stop early never parse the rest of the feed.
+    """
+    return FeedStream([resp.content], str(resp.url), resp.headers).entries()
+
+
+class FeedStream:
+    """Pull-parse feed entries from byte chunks as they arrive.
+
+    Well-formed RSS 2.0, RSS 1.0 and Atom documents are parsed with lxml one
+    entry at a time; the channel title is picked up on the way (see .title).
+    Anything lxml rejects (undeclared HTML entities, broken markup) falls
+    back to a full feedparser pass over the whole document, skipping entries
+    that were already yielded. JSON Feed is not supported and yields nothing.
+    """
+
+    def __init__(self, chunks: Iterable[bytes], url: str, headers: Mapping[str, str]) -> None:
+        self._chunks = iter(chunks)
+        self._received: list[bytes] = []  # Kept for the feedparser fallback
+        self.url = url
+        self.headers = headers
+        self.title = ""
+
+    def entries(self) -> Iterator[Mapping[str, Any]]:
+        yielded = 0
+        head = next(self._chunks, b"")
+        self._received.append(head)
+        kind = sniff(head)
+        if kind == "json":
+            # JSON Feed isn't supported: feedparser 6 only reads XML feeds
+            logger.error("Feed parse error for %s: JSON feeds are not supported", self.url)
+            return
+        # Only the sniffed format's entry tags are watched
+        parser = etree.XMLPullParser(
+            events=("end",), tag=_TITLE_TAGS + _ENTRY_TAGS_BY_KIND.get(kind, _ENTRY_TAGS),
+            resolve_entities=False, no_network=True,
+        )
+        try:
+            for chunk in self._incoming(head):
+                parser.feed(chunk)
+                for entry in self._read_events(parser):
+                    yield entry
+                    yielded += 1
+            parser.close()
+            for entry in self._read_events(parser):
+                yield entry
+                yielded += 1
+            if yielded:
+                return
+        except etree.XMLSyntaxError as exc:
+            logger.debug("Fast parse failed for %s, using feedparser: %s", self.url, exc)
+
+        content = b"".join([*self._received, *self._chunks])
+        feed = _feedparse(content, self.url, self.headers)
+        if feed.bozo and not feed.entries:
+            logger.error("Feed parse error for %s: %s", self.url, feed.bozo_exception)
+            return
+        self.title = self.title or feed.feed.get("title", "")
+        yield from feed.entries[yielded:]
+
+    def _incoming(self, head: bytes) -> Iterator[bytes]:
+        """The sniffed first chunk, then the rest, recording each for the fallback."""
+        yield head
+        for chunk in self._chunks:
+            self._received.append(chunk)
+            yield chunk
+
+    def _read_events(self, parser: etree.XMLPullParser) -> Iterator[dict[str, str]]:
+        """Convert the entries completed so far, freeing each once it has been read."""
+        for _, elem in parser.read_events():
+            if elem.tag in _TITLE_TAGS:
+                parent = elem.getparent()
+                if not self.title and parent is not None and parent.tag in _CHANNEL_TAGS:
+                    self.title = "".join(elem.itertext()).strip()
+                continue
+            yield _entry_fields(elem, self.url)
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+
+
+def _feedparse(content: bytes, url: str, headers: Mapping[str, str]) -> feedparser.FeedParserDict:
+    """Run feedparser over a feed body that has already been downloaded.
+
+    Passing the bytes plus the HTTP headers lets feedparser take the charset
+    from Content-Type and resolve relative links against the final URL,
+    without fetching the document a second time itself.
+
+    The HTML rewriting passes over summaries and content (URI resolution and
+    sanitizing) are skipped: that text only goes into LLM prompts, and every
+    digest escapes what it renders.
+    """
+    return feedparser.parse(
+        content,
+        response_headers={**headers, "content-location": url},
+        resolve_relative_uris=False,
+        sanitize_html=False,
+    )
+
+
+def normalize_date(text: str) -> str:
+    """Convert an RSS (RFC 822) or Atom (ISO 8601) date to ISO 8601.
+
+    RFC 822 zone names such as EST/PDT are understood. Unrecognized
+    strings are returned unchanged.
+    """
+    text = text.strip()
+    if not text:
+        return ""
+    try:
+        dt = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(text)
+        except ValueError:
+            return text
+    return dt.replace(microsecond=0).isoformat()
+
+
+def _entry_fields(elem: etree._Element, base_url: str) -> dict[str, str]:
+    """Extract the fields we use from an RSS item or Atom entry element."""
+    entry: dict[str, str] = {}
+    guid_is_link = False
+    for child in elem:
+        tag = child.tag
+        if tag == "guid" and "id" not in entry:
+            # RSS 2.0: a guid is a permalink unless isPermaLink="false"
+            guid_is_link = child.get("isPermaLink", "true").lower() != "false"
+        if tag == f"{_ATOM}link":
+            if "link" not in entry and child.get("rel", "alternate") == "alternate":
+                href = child.get("href", "")
+                if href:
+                    entry["link"] = urljoin(base_url, href)
+            continue
+
+        key = _ENTRY_FIELDS.get(tag) if isinstance(tag, str) else None
+        if key is None or key in entry:
+            continue
+        if tag == f"{_ATOM}author":
+            text = child.findtext(f"{_ATOM}name", "")
+        else:
+            text = "".join(child.itertext())
+        text = text.strip()
+        if text:
+            entry[key] = urljoin(base_url, text) if key == "link" else text
+
+    if "link" not in entry and guid_is_link and "id" in entry:
+        entry["link"] = urljoin(base_url, entry["id"])
+
+    content = entry.pop("content", "")
+    if "summary" not in entry and content:
+        entry["summary"] = content
+    return entry
+
+
+def fetch_multiple(
+    feeds: list[dict],
+    max_per_feed: int = 10,
+    max_workers: int = 4,
+) -> list[FeedItem]:
+    """Fetch multiple feeds concurrently. Each dict should have 'url' and optionally 'name'.
+
+    Feeds are network-bound, so they are fetched on a small thread pool.
+    Items are returned in the order the feeds were listed. The
+    conditional-GET cache is loaded before and persisted after the batch.
+    """
+    confs = [(f.get("url", ""), f.get("name", "")) for f in feeds]
+    confs = [(url, name) for url, name in confs if url]
+    if not confs:
+        return []
+
+    load_cache()
+    all_items: list[FeedItem] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(confs)))) as pool:
+        for items in pool.map(lambda c: fetch_feed(c[0], c[1], max_per_feed), confs):
+            all_items.extend(items)
+    save_cache()
     return all_items
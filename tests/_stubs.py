@@ -0,0 +1,31 @@
+"""Plain stand-ins for OpenAI chat completion responses."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+@dataclass(slots=True)
+class Msg:
+    content: str | None
+
+
+@dataclass(slots=True)
+class Choice:
+    message: Msg | None = None
+    delta: Msg | None = None
+
+
+@dataclass(slots=True)
+class Resp:
+    choices: list[Choice] = field(default_factory=list)
+
+
+def mk_resp(content: str) -> Resp:
+    """A non-streaming completion whose single choice says content."""
+    return Resp(choices=[Choice(message=Msg(content))])
+
+
+def mk_chunk(content: str | None) -> Resp:
+    """A streaming chunk carrying one text delta."""
+    return Resp(choices=[Choice(delta=Msg(content))])
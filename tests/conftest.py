@@ -0,0 +1,50 @@
+"""Shared pytest fixtures."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+
+from src import llm
+from src.sources import pubmed, rss
+
+
+@pytest.fixture(autouse=True)
+def isolated_module_state(monkeypatch):
+    """Give every test fresh module-level caches and no real rate-limit sleeps.
+
+    Keeps tests independent of run order, so they can be split across
+    pytest-xdist workers (pytest -n auto).
+    """
+    llm.get_client.cache_clear()
+    llm.clear_cache()
+    monkeypatch.setattr(rss, "_feed_cache", OrderedDict())
+    monkeypatch.setattr(rss, "_feed_cache_loaded", True)  # Never read data/ from disk
+    monkeypatch.setattr(rss, "_feed_cache_dirty", False)
+    monkeypatch.setattr(pubmed, "_next_slot", 0.0)
+    monkeypatch.setattr(pubmed, "_min_interval", lambda: 0.0)
+    yield
+    llm.get_client.cache_clear()
+    llm.clear_cache()
+
+
+@pytest.fixture
+def mock_feedparser(monkeypatch):
+    """Make feedparser (the RSS fallback parser) return canned results.
+
+    Yields a function taking the entries to serve, plus an optional feed
+    title and bozo exception; it returns the fake parse result.
+    """
+    def serve(entries: list[dict], title: str = "", bozo_exception: Exception | None = None):
+        result = SimpleNamespace(
+            bozo=bozo_exception is not None,
+            bozo_exception=bozo_exception,
+            feed={"title": title} if title else {},
+            entries=entries,
+        )
+        monkeypatch.setattr("src.sources.rss.feedparser.parse", lambda *args, **kwargs: result)
+        return result
+
+    return serve
@@ -44,7 +44,7 @@ class TestLiteratureAgent:
                 "biorxiv_subjects": ["bioinformatics"],
             }
         }
-        mock_pubmed.search_and_fetch.return_value = [
+        mock_pubmed.search_and_fetch_many.return_value = [
             MagicMock(pmid="123", title="Test", authors="A B", abstract="...",
                       source="J Test", url="http://test", pub_date="2026"),
         ]
@@ -64,6 +64,27 @@ class TestLiteratureAgent:
         assert len(result) == 1
         assert result[0]["id"] == "PMID:2"
 
+    def test_summarize_ignores_out_of_range_items(self):
+        agent = LiteratureAgent(config=MOCK_CONFIG, dry_run=True)
+        items = [
+            {"id": f"PMID:{n}", "title": f"Paper {n}", "authors": "A B",
+             "source": "PubMed", "abstract": "...", "url": f"http://test/{n}"}
+            for n in range(1, 4)
+        ]
+        llm_result = {
+            "summary": "Overview",
+            "assessments": [
+                {"item_number": 3, "one_liner": "third"},
+                {"item_number": 1, "one_liner": "first"},
+                {"item_number": 99, "one_liner": "hallucinated"},
+                {"item_number": "2", "one_liner": "not an int"},
+            ],
+        }
+        with patch.object(agent, "_llm_summarize", return_value=llm_result):
+            result = agent.summarize(items)
+
+        assert [p["title"] for p in result["papers"]] == ["Paper 1", "Paper 3"]
+
 
 class TestEmailTriageAgent:
     @patch("src.agents.email_triage.gmail")
@@ -100,6 +121,26 @@ class TestNewsAgent:
         assert len(items) == 1
         assert items[0]["title"] == "AI News"
 
+    @patch("src.agents.news.rss")
+    @patch("src.agents.news.load_feeds_config")
+    def test_dedup_without_url(self, mock_feeds, mock_rss):
+        mock_feeds.return_value = {"news": {"rss_feeds": []}}
+        prefix = "Shared headline prefix that runs past fifty characters: "
+        mock_rss.fetch_multiple.return_value = [
+            MagicMock(title=prefix + "part one", url="", source="Test",
+                      summary="...", published=""),
+            MagicMock(title=prefix + "part two", url="", source="Test",
+                      summary="...", published=""),
+        ]
+
+        agent = NewsAgent(config=MOCK_CONFIG, dry_run=True)
+        items = agent.fetch()
+        assert items[0]["id"] != items[1]["id"]
+
+        # Items recorded under the old truncated-title ID are still filtered
+        seen = {f"Test:{(prefix + 'part one')[:50]}"}
+        assert agent.dedup(items, seen) == []
+
 
 class TestGrantsAgent:
     @patch("src.agents.grants.grants_gov")
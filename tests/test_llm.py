@@ -3,36 +3,79 @@
 from __future__ import annotations
 
 import json
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
-
-from src.llm import summarize, structured_output, health_check
+from src.llm import get_client, summarize, structured_output, health_check
+from tests._stubs import Resp, mk_chunk, mk_resp
 
 
 class TestHealthCheck:
-    @patch("src.llm.httpx.get")
-    def test_healthy(self, mock_get):
-        mock_get.return_value = MagicMock(status_code=200)
+    def test_healthy(self, monkeypatch):
+        monkeypatch.setattr("src.llm.httpx.get", lambda *a, **k: SimpleNamespace(status_code=200))
         assert health_check() is True
 
-    @patch("src.llm.httpx.get")
-    def test_unhealthy(self, mock_get):
-        mock_get.side_effect = Exception("connection refused")
+    def test_unhealthy(self, monkeypatch):
+        def refuse(*args, **kwargs):
+            raise Exception("connection refused")
+
+        monkeypatch.setattr("src.llm.httpx.get", refuse)
         assert health_check() is False
 
 
+class TestGetClient:
+    def test_reuses_client_per_base_url(self):
+        get_client.cache_clear()
+        try:
+            first = get_client("http://localhost:11434/v1")
+            assert get_client("http://localhost:11434/v1") is first
+            assert get_client("http://other:11434/v1") is not first
+        finally:
+            get_client.cache_clear()
+
+
 class TestSummarize:
     @patch("src.llm.get_client")
     def test_success(self, mock_get_client):
         mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.choices = [MagicMock(message=MagicMock(content="Summary text"))]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = mk_resp("Summary text")
         mock_get_client.return_value = mock_client
 
         result = summarize("system prompt", "user content")
         assert result == "Summary text"
 
+    @patch("src.llm.get_client")
+    def test_streaming(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = iter([
+            mk_chunk("Summary "),
+            Resp(choices=[]),
+            mk_chunk(None),
+            mk_chunk("text"),
+        ])
+        mock_get_client.return_value = mock_client
+
+        tokens: list[str] = []
+        result = summarize("system prompt", "user content", on_token=tokens.append)
+        assert result == "Summary text"
+        assert tokens == ["Summary ", "text"]
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    @patch("src.llm.get_client")
+    def test_repeated_request_is_cached(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mk_resp("Summary text")
+        mock_get_client.return_value = mock_client
+
+        assert summarize("system prompt", "user content") == "Summary text"
+        tokens: list[str] = []
+        assert summarize("system prompt", "user content", on_token=tokens.append) == "Summary text"
+        assert tokens == ["Summary text"]
+        assert mock_client.chat.completions.create.call_count == 1
+
+        summarize("system prompt", "other content")
+        assert mock_client.chat.completions.create.call_count == 2
+
     @patch("src.llm.get_client")
     def test_returns_none_on_failure(self, mock_get_client):
         mock_client = MagicMock()
@@ -48,11 +91,7 @@ class TestStructuredOutput:
     def test_valid_json(self, mock_get_client):
         mock_client = MagicMock()
         expected = {"summary": "test", "items": []}
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(message=MagicMock(content=json.dumps(expected)))
-        ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = mk_resp(json.dumps(expected))
         mock_get_client.return_value = mock_client
 
         result = structured_output("system", "content")
@@ -61,12 +100,16 @@ class TestStructuredOutput:
     @patch("src.llm.get_client")
     def test_invalid_json_returns_none(self, mock_get_client):
         mock_client = MagicMock()
-        mock_response = MagicMock()
-        mock_response.choices = [
-            MagicMock(message=MagicMock(content="not valid json"))
-        ]
-        mock_client.chat.completions.create.return_value = mock_response
+        mock_client.chat.completions.create.return_value = mk_resp("not valid json")
         mock_get_client.return_value = mock_client
 
         result = structured_output("system", "content")
         assert result is None
+
+    @patch("src.llm.get_client")
+    def test_non_object_json_returns_none(self, mock_get_client):
+        mock_client = MagicMock()
+        mock_client.chat.completions.create.return_value = mk_resp('["not", "an", "object"]')
+        mock_get_client.return_value = mock_client
+
+        assert structured_output("system", "content") is None
@@ -2,30 +2,92 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import io
+import os
+from contextlib import nullcontext
+from unittest.mock import patch
 
+import httpx
+import pytest
 
-from src.sources import pubmed, arxiv, rss, grants_gov
+from src.sources import pubmed, arxiv, rss, grants_gov, openfda, gmail, nih_reporter
+from src.sources._html import strip_tags
+from src.sources._sniff import sniff
+
+
+class TestNetworkFailure:
+    @pytest.mark.parametrize(
+        ("client", "method", "call"),
+        [
+            (pubmed._client, "get", lambda: pubmed.search("test query")),
+            (arxiv._client, "get", lambda: arxiv.search("test query")),
+            (rss._client, "stream", lambda: rss.fetch_feed("http://test.com/feed")),
+            (rss._client, "get", lambda: grants_gov.search(keywords=["ai"])),
+            (nih_reporter._client, "post", lambda: nih_reporter.search(["ai"])),
+            (openfda._client, "get", lambda: openfda.search_drug_options("aspirin")),
+        ],
+        ids=["pubmed", "arxiv", "rss", "grants_gov", "nih_reporter", "openfda"],
+    )
+    def test_source_returns_empty(self, monkeypatch, client, method, call):
+        def fail(*args, **kwargs):
+            raise httpx.ConnectTimeout("timeout")
+
+        monkeypatch.setattr(client, method, fail)
+        assert call() == []
 
 
 class TestPubMed:
-    @patch("src.sources.pubmed.httpx.get")
+    @patch.object(pubmed._client, "get")
     def test_search(self, mock_get):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.json.return_value = {
-            "esearchresult": {"idlist": ["123", "456"]}
-        }
-        mock_get.return_value = mock_resp
+        mock_get.return_value = httpx.Response(
+            200,
+            content=b'{"esearchresult": {"idlist": ["123", "456"]}}',
+            request=httpx.Request("GET", pubmed.BASE_URL),
+        )
 
         result = pubmed.search("test query")
         assert result == ["123", "456"]
 
-    @patch("src.sources.pubmed.httpx.get")
-    def test_search_failure(self, mock_get):
-        mock_get.side_effect = Exception("timeout")
-        result = pubmed.search("test query")
-        assert result == []
+    @patch("src.sources.pubmed.fetch_details")
+    @patch("src.sources.pubmed.search")
+    def test_search_and_fetch_many_single_fetch(self, mock_search, mock_fetch):
+        mock_search.side_effect = lambda q, n: {"a": ["1", "2"], "b": ["2", "3"]}[q]
+        mock_fetch.return_value = []
+
+        pubmed.search_and_fetch_many(["a", "b"], max_per_query=5)
+        mock_fetch.assert_called_once_with(["1", "2", "3"])
+
+    @patch.object(pubmed._client, "stream")
+    def test_efetch_many_batches_ids(self, mock_stream):
+        xml = b"""<?xml version="1.0"?>
+        <PubmedArticleSet>
+            <PubmedArticle><MedlineCitation><PMID>1</PMID>
+                <Article><ArticleTitle>First</ArticleTitle></Article>
+            </MedlineCitation></PubmedArticle>
+            <PubmedArticle><MedlineCitation><PMID>2</PMID>
+                <Article><ArticleTitle>Second</ArticleTitle></Article>
+            </MedlineCitation></PubmedArticle>
+        </PubmedArticleSet>"""
+        mock_stream.side_effect = lambda method, url, **kw: nullcontext(
+            httpx.Response(200, content=xml, request=httpx.Request(method, pubmed.BASE_URL + url))
+        )
+
+        articles = pubmed.efetch_many(["1", "2", "3"], chunk=2)
+        # Two requests: ids 1,2 then id 3
+        assert [c.kwargs["data"]["id"] for c in mock_stream.call_args_list] == ["1,2", "3"]
+        assert mock_stream.call_args.args[0] == "POST"
+        assert [a.title for a in articles] == ["First", "Second", "First", "Second"]
+
+    @patch("src.sources.pubmed.time.sleep")
+    @patch("src.sources.pubmed._min_interval", return_value=0.35)
+    def test_rate_limit_reserves_slots(self, _mock_interval, mock_sleep):
+        with patch.object(pubmed, "_next_slot", 0.0):
+            pubmed._rate_limit()
+            pubmed._rate_limit()
+        # Second back-to-back caller waits out (nearly) a full interval
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        assert len(waits) == 1
+        assert 0.3 < waits[0] <= 0.35
 
     def test_parse_xml_valid(self):
         xml = """<?xml version="1.0"?>
@@ -55,23 +117,88 @@ class TestPubMed:
         assert articles[0].pmid == "12345"
         assert articles[0].title == "Test Paper"
         assert "Smith" in articles[0].authors
+        assert pubmed._parse_xml(xml.encode()) == articles
+
+
+class TestGmail:
+    def test_iter_records_ndjson(self):
+        stream = io.BytesIO(b'{"from": "a@x", "subject": "One"}\n\n{"from": "b@x", "subject": "Two"}\n')
+        msgs = [gmail._to_message(r) for r in gmail._iter_records(stream)]
+        assert [m.subject for m in msgs] == ["One", "Two"]
+        assert msgs[0].message_id == "a@x:One:"
+
+    def test_iter_records_json_array(self):
+        stream = io.BytesIO(b'[\n  {"subject": "One"},\n  {"subject": "Two"}\n]\n')
+        assert [r["subject"] for r in gmail._iter_records(stream)] == ["One", "Two"]
+
+    def test_iter_records_empty_array(self):
+        assert list(gmail._iter_records(io.BytesIO(b"[]\n"))) == []
+
+    def test_read_label_survives_noisy_stderr(self, tmp_path, monkeypatch):
+        # More stderr than a pipe buffer holds, written before any output
+        fake = tmp_path / "osascript"
+        fake.write_text(
+            "#!/bin/sh\n"
+            "head -c 200000 /dev/zero | tr '\\0' x >&2\n"
+            "echo '{\"subject\": \"One\"}'\n"
+            "echo '{\"subject\": \"Two\"}'\n"
+        )
+        fake.chmod(0o755)
+        script = tmp_path / "read.applescript"
+        script.touch()
+        monkeypatch.setenv("PATH", f"{tmp_path}:{os.environ['PATH']}")
+        monkeypatch.setattr(gmail, "APPLESCRIPT_PATH", script)
+        monkeypatch.setattr(gmail, "TIMEOUT", 10.0)
+
+        assert [m.subject for m in gmail.read_label(max_items=5)] == ["One", "Two"]
 
 
 class TestArxiv:
-    @patch("src.sources.arxiv.httpx.get")
-    def test_search_failure(self, mock_get):
-        mock_get.side_effect = Exception("timeout")
-        result = arxiv.search("test query")
-        assert result == []
+    def test_parse_atom_valid(self):
+        xml = """<?xml version="1.0" encoding="UTF-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <id>http://arxiv.org/abs/2601.00001v1</id>
+                <published>2026-01-05T12:00:00Z</published>
+                <title>Test
+                    Paper</title>
+                <summary>  An abstract.  </summary>
+                <author><name>Alice</name></author>
+                <author><name>Bob</name></author>
+                <author><name>Carol</name></author>
+                <author><name>Dan</name></author>
+                <category term="cs.AI"/>
+                <category term="cs.CL"/>
+                <link href="http://arxiv.org/pdf/2601.00001v1" type="application/pdf"/>
+                <link href="http://arxiv.org/abs/2601.00001v1" type="text/html"/>
+            </entry>
+        </feed>"""
+
+        papers = arxiv._parse_atom(xml)
+        assert len(papers) == 1
+        assert papers[0].arxiv_id == "2601.00001v1"
+        assert papers[0].title.split() == ["Test", "Paper"]
+        assert papers[0].abstract == "An abstract."
+        assert papers[0].authors == "Alice, Bob, Carol et al."
+        assert papers[0].categories == ["cs.AI", "cs.CL"]
+        assert papers[0].published == "2026-01-05"
+        assert papers[0].url == "http://arxiv.org/abs/2601.00001v1"
+
+
+def _feed_response(url: str, content: bytes = b"", **_kwargs) -> httpx.Response:
+    return httpx.Response(200, content=content, request=httpx.Request("GET", url))
+
+
+def _feed_stream(method: str, url: str, content: bytes = b"", **_kwargs):
+    """Stand-in for _client.stream(): a context manager around a canned response."""
+    return nullcontext(_feed_response(url, content))
 
 
 class TestRSS:
-    @patch("src.sources.rss.feedparser.parse")
-    def test_fetch_feed(self, mock_parse):
-        mock_parse.return_value = MagicMock(
-            bozo=False,
-            feed={"title": "Test Feed"},
-            entries=[
+    @patch.object(rss._client, "stream", side_effect=_feed_stream)
+    def test_fetch_feed(self, mock_stream, mock_feedparser):
+        mock_feedparser(
+            [
                 {
                     "title": "Article 1",
                     "link": "http://test.com/1",
@@ -79,28 +206,222 @@ class TestRSS:
                     "published": "2026-01-01",
                 },
             ],
+            title="Test Feed",
         )
         items = rss.fetch_feed("http://test.com/feed")
         assert len(items) == 1
         assert items[0].title == "Article 1"
+        assert items[0].source == "Test Feed"
 
-    @patch("src.sources.rss.feedparser.parse")
-    def test_fetch_feed_error(self, mock_parse):
-        mock_parse.return_value = MagicMock(
-            bozo=True,
-            bozo_exception=Exception("parse error"),
-            entries=[],
-        )
+    @patch.object(rss._client, "stream", side_effect=_feed_stream)
+    def test_fetch_feed_error(self, mock_stream, mock_feedparser):
+        mock_feedparser([], bozo_exception=Exception("parse error"))
         items = rss.fetch_feed("http://bad.com/feed")
         assert items == []
 
+    @patch.object(rss._client, "stream")
+    @patch("src.sources.rss.feedparser.parse")
+    def test_fetch_feed_fast_path_rss(self, mock_parse, mock_stream):
+        url = "http://test.com/feed"
+        items_xml = "".join(
+            f"<item><title>Article {n}</title><link>/story/{n}</link>"
+            f"<description><![CDATA[<p>Summary {n}</p>]]></description>"
+            f"<pubDate>Thu, 01 Jan 2026 10:00:00 GMT</pubDate></item>"
+            for n in range(1, 6)
+        )
+        body = f"""<?xml version="1.0" encoding="UTF-8"?>
+        <rss version="2.0"><channel><title>Test Feed</title>{items_xml}</channel></rss>"""
+        mock_stream.return_value = nullcontext(_feed_response(url, body.encode()))
+
+        items = rss.fetch_feed(url, max_items=2)
+        assert [i.title for i in items] == ["Article 1", "Article 2"]
+        assert items[0].url == "http://test.com/story/1"
+        assert items[0].source == "Test Feed"
+        assert items[0].summary == "Summary 1"
+        assert items[0].published == "2026-01-01T10:00:00+00:00"
+        mock_parse.assert_not_called()
+
+    def test_guid_permalink_used_as_link(self):
+        body = b"""<rss version="2.0"><channel>
+            <item><title>A</title><guid isPermaLink="true">http://t.com/a</guid></item>
+            <item><title>B</title><guid>http://t.com/b</guid></item>
+            <item><title>C</title><guid isPermaLink="false">tag:t.com,2026:c</guid></item>
+            <item><title>D</title><link>http://t.com/d</link><guid>http://t.com/d?g</guid></item>
+        </channel></rss>"""
+        entries = list(rss.FeedStream([body], "http://t.com/feed", {}).entries())
+        assert [e.get("link") for e in entries] == ["http://t.com/a", "http://t.com/b", None, "http://t.com/d"]
+
+    @patch.object(rss._client, "stream")
+    @patch("src.sources.rss.feedparser.parse")
+    def test_fetch_feed_fast_path_atom(self, mock_parse, mock_stream):
+        url = "http://test.com/atom"
+        body = b"""<?xml version="1.0" encoding="utf-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <title>Atom Feed</title>
+            <entry>
+                <title>Entry 1</title>
+                <link rel="edit" href="http://test.com/edit/1"/>
+                <link href="http://test.com/1"/>
+                <content type="html">Body text</content>
+                <updated>2026-01-01T10:00:00Z</updated>
+            </entry>
+        </feed>"""
+        mock_stream.return_value = nullcontext(_feed_response(url, body))
+
+        items = rss.fetch_feed(url, source_name="Named")
+        assert len(items) == 1
+        assert items[0].url == "http://test.com/1"
+        assert items[0].source == "Named"
+        assert items[0].summary == "Body text"
+        assert items[0].published == "2026-01-01T10:00:00+00:00"
+        mock_parse.assert_not_called()
+
+    @patch.object(rss._client, "stream")
+    def test_fetch_feed_falls_back_to_feedparser(self, mock_stream):
+        # &nbsp; is undeclared in XML, so lxml rejects it and feedparser takes over
+        url = "http://test.com/feed"
+        body = b"""<rss version="2.0"><channel><title>Loose Feed</title>
+            <item><title>Caf&eacute;&nbsp;news</title><link>http://test.com/1</link></item>
+            </channel></rss>"""
+        mock_stream.return_value = nullcontext(_feed_response(url, body))
+
+        items = rss.fetch_feed(url)
+        assert len(items) == 1
+        assert items[0].url == "http://test.com/1"
+        assert items[0].source == "Loose Feed"
+
+    @patch.object(rss._client, "stream")
+    def test_fetch_feed_not_modified_uses_cache(self, mock_stream):
+        url = "http://test.com/feed"
+        body = b"""<rss version="2.0"><channel><title>Cached Feed</title>
+            <item><title>Article 1</title><link>http://test.com/1</link></item>
+            </channel></rss>"""
+        request = httpx.Request("GET", url)
+        mock_stream.side_effect = [
+            nullcontext(httpx.Response(
+                200, content=body, request=request,
+                headers={"ETag": '"v1"', "Last-Modified": "Thu, 01 Jan 2026 10:00:00 GMT"},
+            )),
+            nullcontext(httpx.Response(304, request=request)),
+        ]
+
+        first = rss.fetch_feed(url)
+        second = rss.fetch_feed(url)
+        assert second == first
+        assert second[0].source == "Cached Feed"
+        assert mock_stream.call_args.kwargs["headers"] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Thu, 01 Jan 2026 10:00:00 GMT",
+        }
+
+    @patch.object(rss._client, "stream")
+    def test_fetch_feed_cache_respects_max_items(self, mock_stream):
+        url = "http://test.com/feed"
+        items_xml = "".join(f"<item><title>Article {n}</title></item>" for n in range(1, 6))
+        body = f'<rss version="2.0"><channel><title>Feed</title>{items_xml}</channel></rss>'
+        request = httpx.Request("GET", url)
+        mock_stream.side_effect = lambda method, url, headers: nullcontext(
+            httpx.Response(304, request=request) if headers
+            else httpx.Response(200, content=body.encode(), request=request, headers={"ETag": '"v1"'})
+        )
+
+        assert len(rss.fetch_feed(url, source_name="Short", max_items=2)) == 2
+        # Cached entry holds only 2 items, so a caller wanting 4 refetches in full
+        longer = rss.fetch_feed(url, source_name="Long", max_items=4)
+        assert len(longer) == 4
+        assert mock_stream.call_args.kwargs["headers"] == {}
+        # Both limits are now served from the cache, each with its own label
+        shorter = rss.fetch_feed(url, source_name="Short", max_items=2)
+        assert [i.title for i in shorter] == ["Article 1", "Article 2"]
+        assert {i.source for i in shorter} == {"Short"}
+        assert len(rss.fetch_feed(url, source_name="Long", max_items=4)) == 4
+        assert mock_stream.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert mock_stream.call_count == 4
+
+    @patch.object(rss, "FEED_CACHE_SIZE", 2)
+    @patch.object(rss._client, "stream")
+    def test_fetch_feed_cache_evicts_least_recently_used(self, mock_stream):
+        body = b'<rss version="2.0"><channel><item><title>A</title></item></channel></rss>'
+        mock_stream.side_effect = lambda method, url, headers: nullcontext(httpx.Response(
+            200, content=body, request=httpx.Request(method, url), headers={"ETag": '"v1"'},
+        ))
+
+        for url in ("http://a.com/feed", "http://b.com/feed", "http://a.com/feed", "http://c.com/feed"):
+            rss.fetch_feed(url)
+        assert list(rss._feed_cache) == ["http://a.com/feed", "http://c.com/feed"]
+
+    @patch.object(rss._client, "stream")
+    def test_fetch_feed_stops_reading_after_max_items(self, mock_stream):
+        url = "http://test.com/feed"
+        consumed = []
+
+        def chunks():
+            yield b'<rss version="2.0"><channel><title>Big Feed</title>'
+            for n in range(1, 100):
+                consumed.append(n)
+                yield f"<item><title>Article {n}</title><link>http://test.com/{n}</link></item>".encode()
+            yield b"</channel></rss>"
+
+        mock_stream.return_value = nullcontext(
+            httpx.Response(200, content=chunks(), request=httpx.Request("GET", url))
+        )
+        items = rss.fetch_feed(url, max_items=2)
+        assert [i.title for i in items] == ["Article 1", "Article 2"]
+        assert items[0].source == "Big Feed"
+        assert len(consumed) < 5
+
+    def test_strip_tags(self):
+        text = '<p>Drug &amp; device <b>news</b></p><script>track()</script><!-- ad -->\n  more'
+        assert strip_tags(text) == "Drug & device news more"
+        assert strip_tags("  plain   text ") == "plain text"
+
+    def test_sniff(self):
+        assert sniff(b'\xef\xbb\xbf<?xml version="1.0"?>\n<rss version="2.0"><channel>') == "rss"
+        assert sniff(b'<rss><channel><feedburner:info uri="x"/>') == "rss"
+        assert sniff(b'<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#">') == "rss"
+        assert sniff(b'<feed xmlns="http://www.w3.org/2005/Atom">') == "atom"
+        assert sniff(b'  {"version": "https://jsonfeed.org/version/1.1"}') == "json"
+        assert sniff(b"<html><body>") == "unknown"
+
+    @patch("src.sources.rss.feedparser.parse")
+    def test_json_feed_unsupported(self, mock_parse):
+        body = b'{"version": "https://jsonfeed.org/version/1.1", "items": [{"title": "A"}]}'
+        assert list(rss.FeedStream([body], "http://t.com/feed.json", {}).entries()) == []
+        mock_parse.assert_not_called()
+
+    def test_normalize_date(self):
+        assert rss.normalize_date("Mon, 05 Jan 2026 09:30:00 EST") == "2026-01-05T09:30:00-05:00"
+        assert rss.normalize_date("2026-01-05T09:30:00.123Z") == "2026-01-05T09:30:00+00:00"
+        assert rss.normalize_date("sometime soon") == "sometime soon"
+        assert rss.normalize_date("") == ""
+
+    @patch.object(rss._client, "stream")
+    def test_fetch_feed_http_error(self, mock_stream):
+        url = "http://gone.com/feed"
+        mock_stream.return_value = nullcontext(httpx.Response(404, request=httpx.Request("GET", url)))
+        assert rss.fetch_feed(url) == []
+
+    @patch("src.sources.rss.fetch_feed")
+    def test_fetch_multiple_keeps_feed_order(self, mock_fetch):
+        mock_fetch.side_effect = lambda url, name, max_items: [
+            rss.FeedItem(title=f"{name} item", url=url, source=name,
+                         summary="", published=""),
+        ]
+        feeds = [
+            {"name": "A", "url": "http://a.com/feed"},
+            {"name": "Missing URL"},
+            {"name": "B", "url": "http://b.com/feed"},
+            {"name": "C", "url": "http://c.com/feed"},
+        ]
+        items = rss.fetch_multiple(feeds, max_per_feed=5, max_workers=3)
+        assert [i.source for i in items] == ["A", "B", "C"]
+
 
 class TestGrantsGov:
-    @patch("src.sources.grants_gov.feedparser.parse")
-    def test_search_with_keywords(self, mock_parse):
-        mock_parse.return_value = MagicMock(
-            bozo=False,
-            entries=[
+    @patch.object(rss._client, "get", side_effect=_feed_response)
+    def test_search_with_keywords(self, mock_get, mock_feedparser):
+        mock_feedparser(
+            [
                 {
                     "title": "AI in Healthcare Grant",
                     "summary": "Funding for clinical informatics research",
@@ -122,3 +443,65 @@ class TestGrantsGov:
         results = grants_gov.search(keywords=["clinical informatics"])
         assert len(results) == 1
         assert "Healthcare" in results[0].title
+
+    @patch.object(rss._client, "get")
+    @patch("src.sources.rss.feedparser.parse")
+    def test_search_atom_fast_path(self, mock_parse, mock_get):
+        url = grants_gov.RSS_URL
+        body = b"""<?xml version="1.0" encoding="utf-8"?>
+        <feed xmlns="http://www.w3.org/2005/Atom">
+            <entry>
+                <title>AI in Healthcare Grant</title>
+                <id>GRANT-001</id>
+                <link href="http://grants.gov/1"/>
+                <summary>Funding for &lt;b&gt;clinical informatics&lt;/b&gt;</summary>
+                <published>2026-01-01T00:00:00Z</published>
+                <author><name>HHS</name></author>
+            </entry>
+        </feed>"""
+        mock_get.return_value = _feed_response(url, body)
+
+        results = grants_gov.search(keywords=["clinical informatics"])
+        assert results == [grants_gov.GrantsGovOpportunity(
+            opportunity_id="GRANT-001",
+            title="AI in Healthcare Grant",
+            agency="HHS",
+            deadline="2026-01-01T00:00:00+00:00",
+            url="http://grants.gov/1",
+            description="Funding for clinical informatics",
+        )]
+        mock_parse.assert_not_called()
+
+    def test_keyword_matcher_ignores_case(self):
+        matches = grants_gov._keyword_matcher(("AI", "clinical informatics"))
+        assert matches("Advancing Clinical Informatics Research")
+        assert not matches("Soil Microbiome Study")
+        assert grants_gov._keyword_matcher(()) is None
+
+
+class TestOpenFDA:
+    @patch.object(openfda._client, "get")
+    def test_search_prefers_earlier_strategy(self, mock_get):
+        def respond(url, params):
+            field = params["search"].split(":")[0]
+            body = {
+                "openfda.brand_name": b'{}',
+                "openfda.generic_name": b'{"results": [{"openfda": {"generic_name": ["GENERIC"]}}]}',
+                "openfda.substance_name": b'{"results": [{"openfda": {"generic_name": ["SUBSTANCE"]}}]}',
+            }[field]
+            status = 404 if field == "openfda.brand_name" else 200
+            return httpx.Response(status, content=body, request=httpx.Request("GET", url))
+
+        mock_get.side_effect = respond
+        result = openfda.search_drug_options("hctz")
+        assert [label.generic_name for label in result] == ["GENERIC"]
+
+    def test_deduplicate(self):
+        labels = [
+            openfda.DrugLabel(brand_name="Combo", generic_name="Losartan-Hydrochlorothiazide"),
+            openfda.DrugLabel(brand_name="Brand A", generic_name="hydrochlorothiazide"),
+            openfda.DrugLabel(brand_name="Brand B", generic_name="HYDROCHLOROTHIAZIDE "),
+            openfda.DrugLabel(brand_name="No generic", generic_name=""),
+        ]
+        result = openfda._deduplicate(labels)
+        assert [label.brand_name for label in result] == ["Brand A", "Combo"]